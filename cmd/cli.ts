@@ -276,13 +276,16 @@ program
         stopMonitoring();
 
         if (result.success) {
-          console.log(`✅ Thread scraping completed!`);
-          console.log(`   - Original tweet: ${result.originalTweet ? 'Found' : 'Not found'}`);
-          console.log(`   - Replies scraped: ${result.replies?.length || 0}`);
-          console.log(`   - Total tweets: ${result.tweets.length}`);
+          const summary = [
+            `✅ Thread scraping completed!`,
+            `   - Original tweet: ${result.originalTweet ? 'Found' : 'Not found'}`,
+            `   - Replies scraped: ${result.replies?.length || 0}`,
+            `   - Total tweets: ${result.tweets.length}`,
+          ];
           if (result.runContext?.runDir) {
-            console.log(`   - Output directory: ${result.runContext.runDir}`);
+            summary.push(`   - Output directory: ${result.runContext.runDir}`);
           }
+          console.log(summary.join('\n'));
         } else {
           console.error(`❌ Thread scraping failed: ${result.error}`);
           process.exit(1);
@@ -492,14 +495,15 @@ program
 
       // 显示结果摘要
       if (results && results.length > 0) {
-        console.log('\n📊 Scraping results summary:');
+        // Assemble the summary first so it goes out in a single write
+        const summary: string[] = ['\n📊 Scraping results summary:'];
         results.forEach((result: any) => {
           const p = result.profile;
           const meta: string[] = [];
           if (p?.displayName) meta.push(`${p.displayName}`);
           if (typeof p?.followers === 'number') meta.push(`Followers: ${p.followers}`);
           if (typeof p?.following === 'number') meta.push(`Following: ${p.following}`);
-          console.log(
+          summary.push(
             `- @${result.username}: ${result.tweetCount} tweets${meta.length ? ` | ${meta.join(' · ')}` : ''}`,
           );
         });
@@ -508,9 +512,10 @@ program
           .map((result: any) => result.runContext?.runDir)
           .filter((dir: any): dir is string => dir !== undefined && dir !== null);
         if (runDirs.length > 0) {
-          console.log('\n📂 Output directories:');
-          runDirs.forEach((dir: string) => console.log(`- ${dir}`));
+          summary.push('\n📂 Output directories:');
+          runDirs.forEach((dir: string) => summary.push(`- ${dir}`));
         }
+        console.log(summary.join('\n'));
       }
     } catch (error: any) {
       console.error(`❌ Error: ${error.message}`);
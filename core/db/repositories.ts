@@ -8,6 +8,7 @@ import { PrismaPg } from '@prisma/adapter-pg';
 import { PrismaClient } from '../../generated/prisma/client';
 import { ErrorLog, Job, Task, Tweet } from '../../generated/prisma/client';
 import { createEnhancedLogger } from '../../utils/logger';
+import { FlattenedComment, RedditPost } from '../platforms/reddit/types';
 
 const logger = createEnhancedLogger('DB');
 
@@ -270,3 +271,146 @@ export class TweetRepository {
     return new Set(found.map((t) => t.id));
   }
 }
+
+// ==========================================
+// Part 5: Reddit Repository
+// ==========================================
+
+/** Max IDs per `IN (...)` query, well under Postgres' bind parameter limit */
+const ID_QUERY_CHUNK_SIZE = 1000;
+/** Max rows per createMany / update transaction; ~10 columns each stays under the same limit */
+const ROW_WRITE_CHUNK_SIZE = 1000;
+
+export class RedditRepository {
+  private static async findExistingIds(
+    ids: string[],
+    findMany: (chunk: string[]) => Promise<Array<{ id: string }>>,
+  ): Promise<Set<string>> {
+    const existing = new Set<string>();
+    for (let i = 0; i < ids.length; i += ID_QUERY_CHUNK_SIZE) {
+      const found = await findMany(ids.slice(i, i + ID_QUERY_CHUNK_SIZE));
+      for (const row of found) existing.add(row.id);
+    }
+    return existing;
+  }
+
+  /**
+   * Which of `ids` are already stored, using one `IN` query per chunk
+   * instead of one lookup per post.
+   */
+  static async getExistingPostIds(ids: string[]): Promise<Set<string>> {
+    return RedditRepository.findExistingIds(ids, (chunk) =>
+      prisma.redditPost.findMany({ where: { id: { in: chunk } }, select: { id: true } }),
+    );
+  }
+
+  /**
+   * Insert new posts in chunked createMany calls and refresh the mutable fields
+   * (score, comment count, ...) of posts we already have in one transaction per chunk.
+   */
+  static async savePosts(posts: RedditPost[]): Promise<{ created: number; updated: number }> {
+    const existing = await RedditRepository.getExistingPostIds(posts.map((p) => p.id));
+    const rows = posts.map((post) => ({
+      id: post.id,
+      title: post.title,
+      selftext: post.selftext,
+      author: post.author,
+      subreddit: post.subreddit,
+      score: post.score,
+      upvoteRatio: post.upvote_ratio,
+      numComments: post.num_comments,
+      createdUtc: post.created_utc,
+      url: post.url,
+      permalink: post.permalink,
+      isSelf: post.is_self,
+    }));
+
+    const fresh = posts
+      .map((post, i) => ({
+        ...rows[i],
+        name: post.name || `t3_${post.id}`,
+        subredditNamePrefixed: post.subreddit_name_prefixed || `r/${post.subreddit}`,
+      }))
+      .filter((row) => !existing.has(row.id));
+    let created = 0;
+    for (let i = 0; i < fresh.length; i += ROW_WRITE_CHUNK_SIZE) {
+      const { count } = await prisma.redditPost.createMany({
+        data: fresh.slice(i, i + ROW_WRITE_CHUNK_SIZE),
+        skipDuplicates: true,
+      });
+      created += count;
+    }
+
+    const stale = rows.filter((row) => existing.has(row.id));
+    let updated = 0;
+    for (let i = 0; i < stale.length; i += ROW_WRITE_CHUNK_SIZE) {
+      const chunk = stale.slice(i, i + ROW_WRITE_CHUNK_SIZE);
+      try {
+        await prisma.$transaction(
+          chunk.map(({ id, ...data }) => prisma.redditPost.update({ where: { id }, data })),
+        );
+        updated += chunk.length;
+      } catch (error: any) {
+        logger.error(`Failed to update ${chunk.length} Reddit posts`, error);
+      }
+    }
+
+    return { created, updated };
+  }
+
+  /**
+   * Store the comments of several posts in chunked createMany calls, and refresh
+   * comments we already have in one transaction per chunk, instead of one upsert
+   * round-trip per comment.
+   */
+  static async saveComments(
+    threads: Array<{ postId: string; comments: FlattenedComment[] }>,
+  ): Promise<{ created: number; updated: number }> {
+    const rows = threads.flatMap(({ postId, comments }) =>
+      comments.map((comment) => ({
+        id: comment.id,
+        author: comment.author,
+        body: comment.body,
+        score: comment.score,
+        createdUtc: comment.created_utc,
+        depth: comment.depth,
+        parentId: comment.parent_id,
+        permalink: comment.permalink,
+        postId,
+      })),
+    );
+    const existing = await RedditRepository.findExistingIds(
+      rows.map((row) => row.id),
+      (chunk) =>
+        prisma.redditComment.findMany({ where: { id: { in: chunk } }, select: { id: true } }),
+    );
+
+    const fresh = rows
+      .filter((row) => !existing.has(row.id))
+      .map((row) => ({ ...row, name: `t1_${row.id}` }));
+    let created = 0;
+    for (let i = 0; i < fresh.length; i += ROW_WRITE_CHUNK_SIZE) {
+      const { count } = await prisma.redditComment.createMany({
+        data: fresh.slice(i, i + ROW_WRITE_CHUNK_SIZE),
+        skipDuplicates: true,
+      });
+      created += count;
+    }
+
+    const stale = rows.filter((row) => existing.has(row.id));
+    let updated = 0;
+    for (let i = 0; i < stale.length; i += ROW_WRITE_CHUNK_SIZE) {
+      const chunk = stale.slice(i, i + ROW_WRITE_CHUNK_SIZE);
+      try {
+        await prisma.$transaction(
+          chunk.map(({ id, ...data }) => prisma.redditComment.update({ where: { id }, data })),
+        );
+        updated += chunk.length;
+      } catch (error: any) {
+        logger.error(`Failed to update ${chunk.length} Reddit comments`, error);
+      }
+    }
+
+    return { created, updated };
+  }
+}
@@ -318,10 +318,10 @@ export class CookieManager {
 
   async scanCookieFiles(): Promise<string[]> {
     try {
-      const files = await fs.readdir(this.cookiesDir);
-      this.cookieFiles = files
-        .filter((f) => f.endsWith('.json') && !f.endsWith('.meta.json'))
-        .map((f) => path.join(this.cookiesDir, f));
+      const entries = await fs.readdir(this.cookiesDir, { withFileTypes: true });
+      this.cookieFiles = entries
+        .filter((e) => e.isFile() && e.name.endsWith('.json') && !e.name.endsWith('.meta.json'))
+        .map((e) => path.join(this.cookiesDir, e.name));
       return this.cookieFiles;
     } catch {
       return [];
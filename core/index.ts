@@ -58,7 +58,13 @@ export {
 } from './queue/worker';
 export { createDefaultDependencies } from './scraper-engine';
 export type { ScraperDependencies } from './scraper-engine';
-export { RateLimitManager } from './rate-limit';
+export {
+  AdaptiveRateController,
+  RateControllerRegistry,
+  RateLimitManager,
+  parseRetryAfter,
+  rateControllerRegistry,
+} from './rate-limit';
 export { AntiDetection, FingerprintManager, CookieManager, HumanBehavior, createCookieManager } from './evasion';
 export * from './scrape-unified';
 // Engine
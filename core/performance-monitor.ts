@@ -65,7 +65,6 @@ export class PerformanceMonitor {
   private apiRequestCount: number = 0;
   private apiParseTime: number = 0;
   private apiRetryCount: number = 0;
-  private apiLatencies: number[] = []; // 存储每次请求的延迟
 
   // 计数器
   private tweetsCollected: number = 0;
@@ -147,7 +146,6 @@ export class PerformanceMonitor {
       // API 请求阶段
       this.apiRequestTime += duration;
       this.apiRequestCount++;
-      this.apiLatencies.push(duration);
     }
 
     this.currentPhase = null;
@@ -159,7 +157,6 @@ export class PerformanceMonitor {
   recordApiRequest(latency: number, retried: boolean = false): void {
     this.apiRequestTime += latency;
     this.apiRequestCount++;
-    this.apiLatencies.push(latency);
     if (retried) {
       this.apiRetryCount++;
     }
@@ -261,11 +258,9 @@ export class PerformanceMonitor {
     const totalDuration = (this.endTime || Date.now()) - this.startTime;
     const tweetsPerSecond = totalDuration > 0 ? this.tweetsCollected / (totalDuration / 1000) : 0;
 
-    // 计算 API 平均延迟
+    // 计算 API 平均延迟（由累计耗时和次数得出，无需保留每次延迟）
     const apiAverageLatency =
-      this.apiLatencies.length > 0
-        ? this.apiLatencies.reduce((sum, lat) => sum + lat, 0) / this.apiLatencies.length
-        : 0;
+      this.apiRequestCount > 0 ? this.apiRequestTime / this.apiRequestCount : 0;
 
     // 计算各阶段百分比
     const phaseMetrics: PhaseMetric[] = [];
@@ -445,7 +440,6 @@ export class PerformanceMonitor {
     this.apiRequestCount = 0;
     this.apiParseTime = 0;
     this.apiRetryCount = 0;
-    this.apiLatencies = [];
     this.tweetsCollected = 0;
     this.scrollCount = 0;
     this.sessionSwitches = 0;
@@ -11,11 +11,26 @@ import { createEnhancedLogger } from '../../utils/logger';
 import { ScraperEventBus } from '../scraper-engine.types';
 import { exportRedditToMarkdown } from './reddit/markdown-export';
 import { RedditScraper } from './reddit/scraper';
-import { FlattenedComment, RedditPost, RedditScraperResult } from './reddit/types';
+import { FlattenedComment, RedditPost, RedditScraperResult, RedditSort } from './reddit/types';
 import { PlatformAdapter } from './types';
 
 const logger = createEnhancedLogger('RedditAdapter');
 
+/**
+ * Job strategy -> listing sort(s); an array is fetched concurrently and merged.
+ * Unknown strategies fall back to 'auto'.
+ */
+const STRATEGY_SORTS: Record<string, RedditSort | RedditSort[]> = {
+  auto: 'hot',
+  new: 'new',
+  super_recent: 'new',
+  super_full: ['top', 'hot', 'new'],
+};
+
+// Posts whose comments are written per saveComments call; a failed batch is retried
+// post by post, and cancellation is checked between batches
+const COMMENT_SAVE_BATCH_POSTS = 10;
+
 export const redditAdapter: PlatformAdapter = {
   name: 'reddit',
 
@@ -159,19 +174,8 @@ export const redditAdapter: PlatformAdapter = {
         const subreddit = jobConfig.subreddit;
         const limit = jobConfig.limit || 50;
 
-        // Map strategy to sortType
-        // strategy can be: 'auto', 'super_full', 'super_recent', 'new'
-        // sortType can be: 'hot', 'new', 'top'
-        const strategy = (jobConfig as any).strategy || 'auto';
-        let sortType: 'hot' | 'new' | 'top' = 'hot';
-        if (strategy === 'new' || strategy === 'super_recent') {
-          sortType = 'new';
-        } else if (strategy === 'super_full') {
-          sortType = 'top';
-        } else {
-          // 'auto' or default -> 'hot'
-          sortType = 'hot';
-        }
+        const strategy = jobConfig.strategy || 'auto';
+        const sortType = STRATEGY_SORTS[strategy] ?? STRATEGY_SORTS.auto;
 
         await ctx.log(
           `Starting subreddit scrape: r/${subreddit} (limit: ${limit}, sort: ${sortType}, estimated: ~${((limit * 3) / 60).toFixed(1)} min)`,
@@ -184,7 +188,16 @@ export const redditAdapter: PlatformAdapter = {
         }
 
         const subredditScrapeStartTime = Date.now();
-        const scrapeResult = await scraper.scrapeSubreddit(subreddit, limit, sortType);
+        // Incremental runs look up stored ids before spending requests on their details
+        const knownPostIds = jobConfig.skipExisting
+          ? async (ids: string[]) => {
+              const { RedditRepository } = await import('../db/repositories');
+              return RedditRepository.getExistingPostIds(ids);
+            }
+          : undefined;
+        const scrapeResult = await scraper.scrapeSubreddit(subreddit, limit, sortType, {
+          knownPostIds,
+        });
         const subredditScrapeDuration = Date.now() - subredditScrapeStartTime;
 
         await ctx.log(
@@ -209,80 +222,62 @@ export const redditAdapter: PlatformAdapter = {
       if (posts.length > 0) {
         await ctx.log(`Saving ${posts.length} posts to database...`);
 
-        const { prisma } = await import('../db/prisma');
+        const { RedditRepository } = await import('../db/repositories');
 
-        for (const item of posts) {
+        // Comments reference their post, so only posts that made it into the table get theirs
+        let storedPosts = posts;
+        try {
+          const { created, updated } = await RedditRepository.savePosts(posts);
+          await ctx.log(`Stored posts: ${created} new, ${updated} updated`);
+        } catch (e: any) {
+          await ctx.log(`Failed to save posts: ${e.message}`, 'error');
           try {
-            if (await ctx.getShouldStop()) {
-              throw new Error('Job cancelled');
-            }
+            // Chunks written before the failure are still there
+            const stored = await RedditRepository.getExistingPostIds(posts.map((p) => p.id));
+            storedPosts = posts.filter((p) => stored.has(p.id));
+          } catch {
+            storedPosts = [];
+          }
+          await ctx.log(
+            `Saving comments for ${storedPosts.length}/${posts.length} stored posts only`,
+            'warn',
+          );
+        }
+
+        let commentsCreated = 0;
+        let commentsUpdated = 0;
+        for (let i = 0; i < storedPosts.length; i += COMMENT_SAVE_BATCH_POSTS) {
+          if (await ctx.getShouldStop()) {
+            await ctx.log(
+              `Job cancellation detected, skipping comments of ${storedPosts.length - i} posts`,
+              'warn',
+            );
+            break;
+          }
 
-            // Save post
-            await prisma.redditPost.upsert({
-              where: { id: item.id },
-              update: {
-                title: item.title,
-                selftext: item.selftext,
-                author: item.author,
-                subreddit: item.subreddit,
-                score: item.score,
-                upvoteRatio: item.upvote_ratio,
-                numComments: item.num_comments,
-                createdUtc: item.created_utc,
-                url: item.url,
-                permalink: item.permalink,
-                isSelf: item.is_self,
-              },
-              create: {
-                id: item.id,
-                name: item.name || `t3_${item.id}`,
-                title: item.title,
-                selftext: item.selftext,
-                author: item.author,
-                subreddit: item.subreddit,
-                subredditNamePrefixed: item.subreddit_name_prefixed || `r/${item.subreddit}`,
-                score: item.score,
-                upvoteRatio: item.upvote_ratio,
-                numComments: item.num_comments,
-                createdUtc: item.created_utc,
-                url: item.url,
-                permalink: item.permalink,
-                isSelf: item.is_self,
-              },
-            });
-
-            // Save comments
-            for (const comment of item.comments) {
-              await prisma.redditComment.upsert({
-                where: { id: comment.id },
-                update: {
-                  author: comment.author,
-                  body: comment.body,
-                  score: comment.score,
-                  createdUtc: comment.created_utc,
-                  depth: comment.depth,
-                  parentId: comment.parent_id,
-                  permalink: comment.permalink,
-                  postId: item.id,
-                },
-                create: {
-                  id: comment.id,
-                  name: `t1_${comment.id}`,
-                  author: comment.author,
-                  body: comment.body,
-                  score: comment.score,
-                  createdUtc: comment.created_utc,
-                  depth: comment.depth,
-                  parentId: comment.parent_id,
-                  permalink: comment.permalink,
-                  postId: item.id,
-                },
-              });
+          const batch = storedPosts.slice(i, i + COMMENT_SAVE_BATCH_POSTS);
+          try {
+            const { created, updated } = await RedditRepository.saveComments(
+              batch.map((item) => ({ postId: item.id, comments: item.comments })),
+            );
+            commentsCreated += created;
+            commentsUpdated += updated;
+          } catch {
+            // Retry the batch post by post so one bad thread doesn't cost the others
+            for (const item of batch) {
+              try {
+                const { created, updated } = await RedditRepository.saveComments([
+                  { postId: item.id, comments: item.comments },
+                ]);
+                commentsCreated += created;
+                commentsUpdated += updated;
+              } catch (e: any) {
+                await ctx.log(`Failed to save comments for post ${item.id}: ${e.message}`, 'error');
+              }
             }
-          } catch (e: any) {
-            await ctx.log(`Failed to save post ${item.id}: ${e.message}`, 'error');
           }
         }
+        await ctx.log(`Stored comments: ${commentsCreated} new, ${commentsUpdated} updated`);
 
         await ctx.log(`Saved ${posts.length} posts to database`);
       } else {
@@ -314,7 +309,7 @@ export const redditAdapter: PlatformAdapter = {
         const filename = posts.length === 1
           ? undefined // Let exportRedditToMarkdown use post title
           : `reddit_${subredditName}_${timestamp}.md`; // Multiple posts use timestamp
-        markdownPath = exportRedditToMarkdown(postsForMarkdown, runDir, filename);
+        markdownPath = await exportRedditToMarkdown(postsForMarkdown, runDir, filename);
 
         await ctx.log(`Markdown export saved: ${markdownPath}`, 'info');
         await ctx.log(
@@ -3,10 +3,26 @@
  * Converts Reddit posts and comments to readable Markdown format
  */
 
-import * as fs from 'node:fs';
+import * as fs from 'node:fs/promises';
 import * as path from 'node:path';
+import { mapWithConcurrency } from '../../../utils';
 import { FlattenedComment, RedditPost } from './types';
 
+// Per-post files written at once; keeps the event loop free without flooding libuv's pool
+const FILE_WRITE_CONCURRENCY = 8;
+
+const FILENAME_UNSAFE_CHARS = /[/\\?%*:|"<>]/g;
+const WHITESPACE_RUN = /\s+/g;
+// Reddit's JSON escapes these in titles
+const HTML_ENTITY = /&(amp|lt|gt|quot|#39);/g;
+const HTML_ENTITY_CHARS: Record<string, string> = {
+  amp: '&',
+  lt: '<',
+  gt: '>',
+  quot: '"',
+  '#39': "'",
+};
+
 /**
  * Format a Reddit post with comments as Markdown
  */
@@ -48,8 +64,14 @@ export function formatPostAsMarkdown(post: RedditPost, comments: FlattenedCommen
     lines.push(`## Comments (${comments.length})`);
     lines.push('');
 
+    // Indent strings by depth, built once per depth rather than once per comment
+    const indents: string[] = [''];
     for (const comment of comments) {
-      const indent = '  '.repeat(comment.depth);
+      let indent = indents[comment.depth];
+      if (indent === undefined) {
+        indent = '  '.repeat(comment.depth);
+        indents[comment.depth] = indent;
+      }
       const submitterBadge = comment.is_submitter ? ' `[OP]`' : '';
       const gildedBadge = comment.gilded > 0 ? ` 🏆×${comment.gilded}` : '';
 
@@ -58,11 +80,8 @@ export function formatPostAsMarkdown(post: RedditPost, comments: FlattenedCommen
       );
       lines.push('');
 
-      // Format comment body with proper indentation
-      const bodyLines = comment.body.split('\n');
-      for (const bodyLine of bodyLines) {
-        lines.push(`${indent}${bodyLine}`);
-      }
+      // Format comment body with proper indentation; top-level bodies need none
+      lines.push(indent ? indent + comment.body.split('\n').join(`\n${indent}`) : comment.body);
 
       lines.push('');
     }
@@ -74,12 +93,12 @@ export function formatPostAsMarkdown(post: RedditPost, comments: FlattenedCommen
 /**
  * Export Reddit post(s) to Markdown file
  */
-export function exportRedditToMarkdown(
+export async function exportRedditToMarkdown(
   posts: Array<{ post: RedditPost; comments: FlattenedComment[] }>,
   outputDir: string,
   filename?: string,
-): string {
-  fs.mkdirSync(outputDir, { recursive: true });
+): Promise<string> {
+  await fs.mkdir(outputDir, { recursive: true });
 
   let markdownPath: string;
 
@@ -91,7 +110,7 @@ export function exportRedditToMarkdown(
     markdownPath = path.join(outputDir, basename);
 
     const content = formatPostAsMarkdown(post.post, post.comments);
-    fs.writeFileSync(markdownPath, content, 'utf-8');
+    await fs.writeFile(markdownPath, content, 'utf-8');
   } else {
     // Multiple posts - create index
     markdownPath = path.join(outputDir, filename || 'index.md');
@@ -125,19 +144,17 @@ export function exportRedditToMarkdown(
       lines.push('');
     }
 
-    fs.writeFileSync(markdownPath, lines.join('\n'), 'utf-8');
+    await fs.writeFile(markdownPath, lines.join('\n'), 'utf-8');
 
     // Also save individual posts
-    for (let i = 0; i < posts.length; i++) {
-      const { post, comments } = posts[i];
+    await mapWithConcurrency(posts, FILE_WRITE_CONCURRENCY, ({ post, comments }, i) => {
       const sanitizedTitle = sanitizeFilename(post.title);
       const postPath = path.join(
         outputDir,
         `${String(i + 1).padStart(3, '0')}-${sanitizedTitle}.md`,
       );
-      const content = formatPostAsMarkdown(post, comments);
-      fs.writeFileSync(postPath, content, 'utf-8');
-    }
+      return fs.writeFile(postPath, formatPostAsMarkdown(post, comments), 'utf-8');
+    });
   }
 
   return markdownPath;
@@ -150,7 +167,8 @@ function sanitizeFilename(name: string): string {
   // Use 50 chars max to be safe with multi-byte characters (e.g. Chinese = 3 bytes)
   // Filesystems typically have 255 byte limit. 50 * 4 + extension < 255
   return name
-    .replace(/[/\\?%*:|"<>]/g, '-')
-    .replace(/\s+/g, '_')
+    .replace(HTML_ENTITY, (_, entity: string) => HTML_ENTITY_CHARS[entity])
+    .replace(FILENAME_UNSAFE_CHARS, '-')
+    .replace(WHITESPACE_RUN, '_')
     .slice(0, 50);
 }
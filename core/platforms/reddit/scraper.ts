@@ -5,11 +5,20 @@
  * Follows the same architectural patterns as Twitter adapter
  */
 
+import * as http from 'node:http';
+import * as https from 'node:https';
 import axios, { AxiosInstance, AxiosRequestConfig } from 'axios';
 import { HttpProxyAgent } from 'http-proxy-agent';
 import { HttpsProxyAgent } from 'https-proxy-agent';
-import { createEnhancedLogger } from '../../../utils';
+import { USER_AGENT_POOL } from '../../../config/constants';
+import { createEnhancedLogger, mapWithConcurrency, TtlCache } from '../../../utils';
 import { ProxyConfig } from '../../browser-manager';
+import {
+  AdaptiveRateController,
+  parseRateLimitQuota,
+  parseRetryAfter,
+  rateControllerRegistry,
+} from '../../rate-limit';
 import { ScraperEventBus } from '../../scraper-engine.types';
 import {
   FlattenedComment,
@@ -18,18 +27,288 @@ import {
   RedditPost,
   RedditScraperConfig,
   RedditScraperResult,
+  RedditSort,
   RedditThing,
 } from './types';
 
 const logger = createEnhancedLogger('RedditScraper');
 
+const REDDIT_HOST = 'www.reddit.com';
+const REDDIT_ORIGIN = `https://${REDDIT_HOST}`;
+
+// Post detail requests in flight per scrape; pacing is left to the rate controller
+const POST_FETCH_CONCURRENCY = 4;
+// checkCancel runs per post/page/retry; the 500ms poller aborts in between, so calls
+// inside this window reuse the last answer instead of asking the job queue again
+const STOP_CHECK_TTL_MS = 500;
+
+// Hold after a 429 with no Retry-After outside cooldown: doubles with the 429 streak,
+// from 5s up to the 60s Reddit used to be given by default
+const RATE_LIMIT_BACKOFF_BASE_MS = 5000;
+const RATE_LIMIT_BACKOFF_CAP_MS = 60 * 1000;
+
+// Post id from a permalink or full URL: /r/{subreddit}/comments/{id}/{title}/
+const POST_ID_PATTERN = /\/comments\/([^/]+)/;
+
+// Keep-alive pools shared by every scraper instance, so paginated requests
+// reuse TCP/TLS connections instead of handshaking each time
+const AGENT_OPTIONS = {
+  keepAlive: true,
+  keepAliveMsecs: 30000,
+  maxSockets: 50,
+  maxFreeSockets: 20,
+};
+const directAgents = {
+  httpAgent: new http.Agent(AGENT_OPTIONS),
+  httpsAgent: new https.Agent(AGENT_OPTIONS),
+};
+const proxyAgents = new Map<
+  string,
+  { httpAgent: HttpProxyAgent<string>; httpsAgent: HttpsProxyAgent<string> }
+>();
+
+// Listing pages reused across jobs in this process; fast-moving sorts expire sooner
+const listingCache = new TtlCache<string, RedditListing>(200);
+const LISTING_CACHE_TTL_MS: Record<RedditSort, number> = {
+  top: 30 * 60 * 1000,
+  hot: 5 * 60 * 1000,
+  new: 60 * 1000,
+};
+
+// Fetched threads, so a post requested again shortly (re-run, repeated single-post job)
+// skips the request and comment parsing; short TTL since scores and comments keep moving
+const postCache = new TtlCache<string, { post: RedditPost; comments: FlattenedComment[] }>(512);
+const POST_CACHE_TTL_MS = 2 * 60 * 1000;
+
+// Diagnostic hints attached to failure logs, built once rather than per error
+const TIMEOUT_HINTS = {
+  possibleReasons: [
+    'Network too slow',
+    'Reddit server not responding',
+    'Proxy timeout',
+    'DNS resolution timeout',
+    'Firewall blocking',
+    'Reddit blocking requests',
+  ],
+  suggestions: [
+    'Check internet connection',
+    'Try using proxy (enable proxy in task form)',
+    'Check if Reddit is accessible (visit reddit.com in browser)',
+    'Check firewall/antivirus settings',
+    'Try again later',
+  ],
+} as const;
+const NETWORK_HINTS = {
+  possibleReasons: ['DNS failure', 'Server unreachable', 'Proxy issue'],
+  suggestions: ['Try using proxy', 'Check DNS settings', 'Check network connection'],
+} as const;
+const LISTING_FORBIDDEN_REASONS = [
+  'Proxy IP blocked by Reddit',
+  'Private subreddit',
+  'Banned subreddit',
+] as const;
+const POST_FORBIDDEN_REASONS = [
+  'Proxy IP blocked by Reddit',
+  'Rate limited',
+  'Post removed',
+  'Private subreddit',
+] as const;
+const EMPTY_LISTING_REASONS = [
+  'Subreddit does not exist',
+  'Subreddit is private/banned',
+  'Network/proxy issues',
+  'Reddit API rate limiting',
+  'Invalid subreddit name',
+] as const;
+
+// One complete header set per pooled User-Agent, built once; a client takes a whole
+// profile so the UA and the rest of its headers always travel together
+const REQUEST_HEADER_PROFILES = USER_AGENT_POOL.map((userAgent) => ({
+  'User-Agent': userAgent,
+  Accept: 'application/json',
+  'Accept-Language': 'en-US,en;q=0.9',
+}));
+let headerProfileCursor = Math.floor(Math.random() * REQUEST_HEADER_PROFILES.length);
+
+function nextRequestHeaders() {
+  headerProfileCursor = (headerProfileCursor + 1) % REQUEST_HEADER_PROFILES.length;
+  // Copy so axios can't mutate the shared profile
+  return { ...REQUEST_HEADER_PROFILES[headerProfileCursor] };
+}
+
+/**
+ * What handleRateLimit did about a 429: rotated to a fresh proxy (whose rate controller
+ * has no hold), or held the current one for `waitMs`.
+ */
+interface RateLimitOutcome {
+  switched: boolean;
+  waitMs: number;
+}
+
+/**
+ * Log line for a 429, given what handleRateLimit did
+ */
+function rateLimitMessage({ switched, waitMs }: RateLimitOutcome): string {
+  if (switched) return 'Rate limited (429). Switched proxy, retrying without waiting...';
+  if (waitMs > 0) {
+    return `Rate limited (429). Waiting ${Math.ceil(waitMs / 1000)}s before retry...`;
+  }
+  return 'Rate limited (429). Retry-After is 0, retrying now...';
+}
+
+/**
+ * Keep only what pagination reads (post id/permalink, after/dist) so cached pages don't
+ * pin full post bodies; a 100-post page shrinks from hundreds of KB to a few KB.
+ */
+function slimListing(listing: RedditListing): RedditListing {
+  return {
+    kind: listing.kind,
+    data: {
+      ...listing.data,
+      children: listing.data.children.map((child) => ({
+        kind: child.kind,
+        data: child.kind === 't3' ? { id: child.data.id, permalink: child.data.permalink } : {},
+      })),
+    },
+  };
+}
+
+/**
+ * Copy just the fields RedditPost declares. The raw t3 object carries ~100 more
+ * (selftext_html, media_metadata, awardings, ...) that would otherwise stay pinned
+ * in memory for every post until the job finishes.
+ */
+function pickPostFields(raw: RedditPost): RedditPost {
+  return {
+    id: raw.id,
+    name: raw.name,
+    title: raw.title,
+    selftext: raw.selftext,
+    author: raw.author,
+    subreddit: raw.subreddit,
+    subreddit_name_prefixed: raw.subreddit_name_prefixed,
+    score: raw.score,
+    upvote_ratio: raw.upvote_ratio,
+    num_comments: raw.num_comments,
+    created_utc: raw.created_utc,
+    url: raw.url,
+    permalink: raw.permalink,
+    is_self: raw.is_self,
+    link_flair_text: raw.link_flair_text,
+    gilded: raw.gilded,
+    over_18: raw.over_18,
+    thumbnail: raw.thumbnail,
+    media: raw.media,
+    preview: raw.preview,
+  };
+}
+
+/**
+ * Flatten a comment tree depth-first (each comment followed by its replies).
+ * Walks an explicit stack, so deep reply chains can't overflow the call stack.
+ */
+function flattenComments(listing?: RedditListing): FlattenedComment[] {
+  const comments: FlattenedComment[] = [];
+  if (!listing) return comments;
+
+  const stack: RedditThing[] = listing.data.children.slice().reverse();
+  for (let child = stack.pop(); child; child = stack.pop()) {
+    if (child.kind !== 't1') continue;
+    const c = child.data as RedditComment;
+    comments.push({
+      id: c.id,
+      author: c.author,
+      body: c.body,
+      score: c.score,
+      created_utc: c.created_utc,
+      depth: c.depth || 0,
+      parent_id: c.parent_id,
+      permalink: c.permalink,
+      is_submitter: c.is_submitter,
+      gilded: c.gilded,
+      controversiality: c.controversiality,
+    });
+
+    const replies = c.replies;
+    if (replies && typeof replies === 'object' && replies.kind === 'Listing') {
+      const children = replies.data.children;
+      // Reverse push so the first reply is popped first
+      for (let i = children.length - 1; i >= 0; i--) stack.push(children[i]);
+    }
+  }
+  return comments;
+}
+
+/**
+ * Copy a cached thread on the way in and out of postCache, so a job that edits the
+ * post or comments it got back can't change what other jobs read from the cache.
+ */
+function copyThread(thread: { post: RedditPost; comments: FlattenedComment[] }): {
+  post: RedditPost;
+  comments: FlattenedComment[];
+} {
+  return {
+    post: { ...thread.post },
+    comments: thread.comments.map((comment) => ({ ...comment })),
+  };
+}
+
+/**
+ * Reddit's JSON endpoint for a post URL: one trailing slash dropped and `.json` added
+ * before any query string, unless the URL already points at it.
+ */
+function toPostJsonUrl(postUrl: string): string {
+  const url = postUrl.endsWith('/') ? postUrl.slice(0, -1) : postUrl;
+  if (url.endsWith('.json')) return url;
+  const queryStart = url.indexOf('?');
+  if (queryStart === -1) return `${url}.json`;
+  return `${url.slice(0, queryStart)}.json${url.slice(queryStart)}`;
+}
+
+/**
+ * Merge per-sort post lists round-robin, so every sort contributes to the first
+ * `limit` posts, skipping ids already taken. Null lists (failed sorts) are skipped.
+ */
+function mergeRoundRobin(
+  lists: Array<Array<{ url: string; id: string }> | null>,
+  limit: number,
+): Array<{ url: string; id: string }> {
+  const merged = new Map<string, { url: string; id: string }>();
+  const longest = Math.max(0, ...lists.map((list) => list?.length ?? 0));
+  for (let i = 0; i < longest && merged.size < limit; i++) {
+    for (const list of lists) {
+      const item = list?.[i];
+      if (!item || merged.has(item.id)) continue;
+      merged.set(item.id, item);
+      if (merged.size >= limit) break;
+    }
+  }
+  return Array.from(merged.values());
+}
+
+function getProxyAgents(proxyUrl: string) {
+  let agents = proxyAgents.get(proxyUrl);
+  if (!agents) {
+    agents = {
+      httpAgent: new HttpProxyAgent(proxyUrl, AGENT_OPTIONS),
+      httpsAgent: new HttpsProxyAgent(proxyUrl, AGENT_OPTIONS),
+    };
+    proxyAgents.set(proxyUrl, agents);
+  }
+  return agents;
+}
+
 export class RedditScraper {
   private client: AxiosInstance;
   private eventBus?: ScraperEventBus;
   private shouldStop?: () => Promise<boolean> | boolean;
+  // Aborted only when the job is cancelled. Slow-request switches and timeouts abort
+  // a per-request controller instead (see requestSignal), so they never touch siblings.
   private abortController: AbortController;
   private proxyManager?: any; // ProxyManager instance for auto-rotation
   private currentProxy?: ProxyConfig & { id?: string }; // Current proxy config with ID
+  private rateController: AdaptiveRateController;
+  private lastStopCheckAt = Number.NEGATIVE_INFINITY;
 
   constructor(
     proxyConfig?: ProxyConfig & { id?: string },
@@ -42,6 +321,7 @@ export class RedditScraper {
     this.abortController = new AbortController();
     this.proxyManager = proxyManager;
     this.currentProxy = proxyConfig;
+    this.rateController = this.getRateController();
 
     // Setup periodic cancellation check
     if (shouldStop) {
@@ -56,13 +336,8 @@ export class RedditScraper {
     }
 
     const axiosConfig: AxiosRequestConfig = {
-      headers: {
-        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
-        Accept: 'application/json',
-        'Accept-Language': 'en-US,en;q=0.9',
-      },
+      headers: nextRequestHeaders(),
       timeout: 20000, // 20s timeout - will retry on timeout
-      signal: this.abortController.signal,
       validateStatus: (status) => status < 500, // Don't throw on 4xx
     };
 
@@ -74,8 +349,7 @@ export class RedditScraper {
           ? `http://${proxyConfig.username}:${proxyConfig.password}@${proxyConfig.host}:${proxyConfig.port}`
           : `http://${proxyConfig.host}:${proxyConfig.port}`;
 
-      const httpsAgent = new HttpsProxyAgent(proxyUrl);
-      const httpAgent = new HttpProxyAgent(proxyUrl);
+      const { httpAgent, httpsAgent } = getProxyAgents(proxyUrl);
 
       axiosConfig.httpsAgent = httpsAgent;
       axiosConfig.httpAgent = httpAgent;
@@ -96,6 +370,8 @@ export class RedditScraper {
       });
     } else {
       axiosConfig.proxy = false;
+      axiosConfig.httpsAgent = directAgents.httpsAgent;
+      axiosConfig.httpAgent = directAgents.httpAgent;
       this.log('🌐 Axios client configured for direct connection (no proxy)', 'info', {
         proxyEnabled: false,
       });
@@ -140,25 +416,7 @@ export class RedditScraper {
       password: nextProxy.password || '',
       id: nextProxy.id,
     };
-
-    // Create new abort controller if the current one is aborted
-    // This is critical: if the old controller was aborted, new requests will fail immediately
-    if (this.abortController.signal.aborted) {
-      this.abortController = new AbortController();
-      // Re-setup periodic cancellation check if needed
-      if (this.shouldStop) {
-        const shouldStopFn = this.shouldStop;
-        const checkInterval = setInterval(async () => {
-          const shouldStop =
-            typeof shouldStopFn === 'function' ? await shouldStopFn() : shouldStopFn;
-          if (shouldStop) {
-            this.abortController.abort();
-            clearInterval(checkInterval);
-          }
-        }, 500);
-        checkInterval.unref();
-      }
-    }
+    this.rateController = this.getRateController();
 
     // Recreate axios client with new proxy using HttpsProxyAgent
     const proxyUrl =
@@ -166,17 +424,11 @@ export class RedditScraper {
         ? `http://${nextProxy.username}:${nextProxy.password}@${nextProxy.host}:${nextProxy.port}`
         : `http://${nextProxy.host}:${nextProxy.port}`;
 
-    const httpsAgent = new HttpsProxyAgent(proxyUrl);
-    const httpAgent = new HttpProxyAgent(proxyUrl);
+    const { httpAgent, httpsAgent } = getProxyAgents(proxyUrl);
 
     const axiosConfig: AxiosRequestConfig = {
-      headers: {
-        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
-        Accept: 'application/json',
-        'Accept-Language': 'en-US,en;q=0.9',
-      },
+      headers: nextRequestHeaders(),
       timeout: 20000,
-      signal: this.abortController.signal, // Use the (possibly new) abort controller
       validateStatus: (status) => status < 500,
       httpsAgent,
       httpAgent,
@@ -195,7 +447,38 @@ export class RedditScraper {
     return true;
   }
 
-  private log(message: string, level: 'info' | 'warn' | 'error' = 'info', details?: any) {
+  /**
+   * Switch away from the proxy a failed request went out on. Concurrent requests can
+   * fail on the same proxy; the first one switches, the rest find it already replaced
+   * and retry on the new one without marking it failed for an error it never saw.
+   */
+  private rotateProxyFrom(requestProxyId: string | undefined, reason: string): boolean {
+    if (requestProxyId !== this.currentProxy?.id) return true;
+    return this.switchToNextProxy(reason);
+  }
+
+  /**
+   * Signal for one request: fires when the job is cancelled or when `controller` is
+   * aborted by that request's own slow-response timers.
+   */
+  private requestSignal(controller: AbortController): AbortSignal {
+    return AbortSignal.any([this.abortController.signal, controller.signal]);
+  }
+
+  /**
+   * 'debug' is for per-request chatter: it goes to the local logger only (dropped
+   * unless LOG_LEVEL=debug) and never to the job event bus
+   */
+  private log(
+    message: string,
+    level: 'debug' | 'info' | 'warn' | 'error' = 'info',
+    details?: any,
+  ) {
+    if (level === 'debug') {
+      logger.debug(message, details);
+      return;
+    }
+
     const timestamp = new Date().toISOString();
     const logMessage = details ? `${message} | Details: ${JSON.stringify(details)}` : message;
 
@@ -214,7 +497,9 @@ export class RedditScraper {
 
   private async checkCancel(): Promise<void> {
     try {
-      if (this.shouldStop) {
+      const now = performance.now();
+      if (this.shouldStop && now - this.lastStopCheckAt >= STOP_CHECK_TTL_MS) {
+        this.lastStopCheckAt = now;
         const shouldStop = await this.shouldStop();
         if (shouldStop) {
           this.log('Cancellation check: Job should stop', 'warn');
@@ -240,7 +525,7 @@ export class RedditScraper {
     let elapsed = 0;
     const delayStartTime = Date.now();
 
-    this.log(`Starting delay of ${ms}ms`, 'info', { delayMs: ms });
+    this.log(`Starting delay of ${ms}ms`, 'debug', { delayMs: ms });
 
     while (elapsed < ms) {
       await this.checkCancel();
@@ -254,7 +539,7 @@ export class RedditScraper {
       if (elapsed % 2000 < step) {
         this.log(
           `Delay progress: ${elapsed}/${ms}ms (${((elapsed / ms) * 100).toFixed(1)}%)`,
-          'info',
+          'debug',
           {
             elapsed,
             total: ms,
@@ -265,44 +550,117 @@ export class RedditScraper {
     }
 
     const actualDelay = Date.now() - delayStartTime;
-    this.log(`Delay completed`, 'info', {
+    this.log(`Delay completed`, 'debug', {
       requested: ms,
       actual: actualDelay,
       difference: actualDelay - ms,
     });
   }
 
+  /**
+   * Rate controller shared by every scraper using the same proxy (or direct connection)
+   */
+  private getRateController(): AdaptiveRateController {
+    const proxy = this.currentProxy;
+    const route = proxy ? proxy.id || `${proxy.host}:${proxy.port}` : 'direct';
+    return rateControllerRegistry.get(`${route}@${REDDIT_HOST}`);
+  }
+
+  /**
+   * Wait until the rate controller grants a token for the next request
+   */
+  private async throttle(): Promise<void> {
+    await this.rateController.acquire((ms) => this.delay(ms));
+  }
+
+  /**
+   * Feed Reddit's X-Ratelimit-* headers to the rate controller, so pacing follows the
+   * quota the server reports instead of only backing off after a 429.
+   */
+  private recordQuota(headers?: Record<string, any>): void {
+    const quota = parseRateLimitQuota(headers);
+    if (quota) this.rateController.recordQuota(quota.remaining, quota.resetMs);
+  }
+
+  /**
+   * Record a 429 and hold the rate controller for the server's Retry-After if present,
+   * otherwise for the cooldown tier, or outside cooldown for a backoff that doubles with
+   * the 429 streak. The wait itself happens in the next throttle(), so every request
+   * sharing the controller honours it. Repeated 429s on one proxy rotate to the next one
+   * instead of waiting.
+   */
+  private handleRateLimit(headers?: Record<string, any>): RateLimitOutcome {
+    const retryAfterMs = parseRetryAfter(headers?.['retry-after']);
+    this.rateController.record429(retryAfterMs);
+    if (this.rateController.needsSessionRefresh()) {
+      this.rateController.markSessionRefreshed();
+      if (this.switchToNextProxy('Repeated 429 rate limits')) return { switched: true, waitMs: 0 };
+    }
+    if (retryAfterMs !== undefined) return { switched: false, waitMs: retryAfterMs };
+
+    let waitMs = this.rateController.getCooldownWaitTime();
+    if (waitMs === 0) {
+      const streak = Math.max(1, Math.round(this.rateController.getStats().consecutive429s));
+      waitMs = Math.min(RATE_LIMIT_BACKOFF_CAP_MS, RATE_LIMIT_BACKOFF_BASE_MS * 2 ** (streak - 1));
+    }
+    this.rateController.holdFor(waitMs);
+    return { switched: false, waitMs };
+  }
+
+  /**
+   * Fail the listing once one page has been rate limited more than `maxRetries` times,
+   * rather than retrying the same page forever.
+   */
+  private checkRateLimitRetries(retries: number, maxRetries: number, page: number): void {
+    if (retries < maxRetries) return;
+    this.log(`Rate limited (429) on page ${page} ${retries + 1} times, giving up`, 'error', {
+      page,
+      attempts: retries + 1,
+      rateLimit: this.rateController.getStats(),
+    });
+    throw new Error(`Rate limited (429) fetching page ${page} after ${retries + 1} attempts`);
+  }
+
   /**
    * Fetch post list from subreddit
    */
   async fetchPostList(
     subreddit: string,
     limit: number,
-    sort: 'hot' | 'new' | 'top' = 'hot',
+    sort: RedditSort = 'hot',
   ): Promise<Array<{ url: string; id: string }>> {
     await this.checkCancel();
 
     this.log(`Fetching post list from r/${subreddit} (limit: ${limit}, sort: ${sort})`);
 
-    const posts: Array<{ url: string; id: string }> = [];
+    // Keyed by post id: listings shift while we page through them, so the same post
+    // can show up twice, and one map both dedups and keeps first-seen order
+    const posts = new Map<string, { url: string; id: string }>();
     let after: string | null = null;
     let page = 1;
-
-    while (posts.length < limit) {
+    const maxRetries = 3;
+    // 429s on the current page. The retry loop below restarts for each 429, so this
+    // count lives outside it and only resets once the page is fetched.
+    let rateLimitRetries = 0;
+    // Only limit/after change between pages
+    const url = `${REDDIT_ORIGIN}/r/${subreddit}/${sort}.json`;
+    const cacheKeyBase = `${subreddit.toLowerCase()}/${sort}`;
+
+    while (posts.size < limit) {
       await this.checkCancel();
 
-      this.log(`Fetching page ${page}... (found ${posts.length}/${limit})`);
+      this.log(`Fetching page ${page}... (found ${posts.size}/${limit})`);
 
-      const url = `https://www.reddit.com/r/${subreddit}/${sort}.json`;
       const requestParams: Record<string, any> = {
-        limit: Math.min(100, limit - posts.length),
+        limit: Math.min(100, limit - posts.size),
         after,
       };
 
       // Retry logic for page fetching
       let lastError: any = null;
       let retryCount = 0;
-      const maxRetries = 3;
+      // Proxy the latest attempt went out on, so a failure only rotates away from that one
+      let requestProxyId = this.currentProxy?.id;
       let response: {
         data: RedditListing;
         status: number;
@@ -310,6 +668,14 @@ export class RedditScraper {
         headers: any;
       } | null = null;
 
+      const cacheKey = `${cacheKeyBase}?limit=${requestParams.limit}&after=${after ?? ''}`;
+      const cachedListing = listingCache.get(cacheKey);
+      const fromCache = cachedListing !== undefined;
+      if (cachedListing) {
+        this.log(`Page ${page} served from listing cache`, 'debug', { cacheKey });
+        response = { data: cachedListing, status: 200, statusText: 'OK (cached)', headers: {} };
+      }
+
       while (retryCount <= maxRetries && !response) {
         await this.checkCancel();
 
@@ -326,8 +692,8 @@ export class RedditScraper {
         }
 
         try {
-          // Check if using proxy via httpsAgent or currentProxy
-          const isUsingProxy = !!(this.client.defaults.httpsAgent || this.currentProxy);
+          // Direct mode also sets an httpsAgent (keep-alive pool), so check currentProxy
+          const isUsingProxy = !!this.currentProxy;
           const proxyInfo =
             isUsingProxy && this.currentProxy
               ? {
@@ -339,19 +705,22 @@ export class RedditScraper {
                 }
               : { usingProxy: false, connectionMode: 'direct' };
 
-          this.log(`Making HTTP request to Reddit API`, 'info', {
+          this.log(`Making HTTP request to Reddit API`, 'debug', {
             url,
             params: requestParams,
             page,
             attempt: retryCount + 1,
             maxRetries: maxRetries + 1,
-            currentPosts: posts.length,
+            currentPosts: posts.size,
             targetLimit: limit,
             ...proxyInfo,
           });
 
+          // Wait for a token before arming the slow-request timers below
+          await this.throttle();
+
           const requestStartTime = Date.now();
-          this.log(`HTTP request starting... (timeout: 20s)`, 'info', {
+          this.log(`HTTP request starting... (timeout: 20s)`, 'debug', {
             url,
             timeout: 20000,
             attempt: retryCount + 1,
@@ -361,7 +730,9 @@ export class RedditScraper {
 
           // Smart timeout handling: cancel and switch proxy if slow
           const warningIntervals: NodeJS.Timeout[] = [];
+          const requestController = new AbortController();
           let requestAborted = false;
+          requestProxyId = this.currentProxy?.id;
 
           // 5s warning
           const warning5s = setTimeout(() => {
@@ -383,12 +754,7 @@ export class RedditScraper {
           // 8s: Smart switch - cancel and retry with new proxy if available
           const smartSwitchTimeout = setTimeout(() => {
             const elapsed = Date.now() - requestStartTime;
-            if (
-              this.proxyManager &&
-              this.currentProxy?.id &&
-              retryCount < maxRetries &&
-              !requestAborted
-            ) {
+            if (this.proxyManager && requestProxyId && retryCount < maxRetries && !requestAborted) {
               this.log(
                 `🔄 Smart switch: Request too slow (${(elapsed / 1000).toFixed(1)}s), switching proxy immediately`,
                 'warn',
@@ -396,23 +762,20 @@ export class RedditScraper {
                   elapsed: `${(elapsed / 1000).toFixed(1)}s`,
                   page,
                   attempt: retryCount + 1,
-                  previousProxy: this.currentProxy.id,
+                  previousProxy: requestProxyId,
                   reason: 'slow_response_8s',
                 },
               );
 
-              // Mark proxy as failed and switch (switchToNextProxy will handle abort controller)
-              this.proxyManager.markProxyFailed(
-                this.currentProxy.id,
-                `Slow response: ${(elapsed / 1000).toFixed(1)}s`,
-              );
-
-              // Abort current request
-              this.abortController.abort();
+              // Abort only this request; other listings in flight keep going
+              requestController.abort();
               requestAborted = true;
 
-              // Switch proxy (this will create new abort controller if needed)
-              this.switchToNextProxy(`Slow response: ${(elapsed / 1000).toFixed(1)}s`);
+              // Marks the proxy as failed, unless another request already switched away
+              this.rotateProxyFrom(
+                requestProxyId,
+                `Slow response: ${(elapsed / 1000).toFixed(1)}s`,
+              );
             }
           }, 8000); // Switch after 8 seconds
           warningIntervals.push(smartSwitchTimeout);
@@ -436,6 +799,7 @@ export class RedditScraper {
           try {
             response = await this.client.get(url, {
               params: requestParams,
+              signal: this.requestSignal(requestController),
             });
             // Clear all warnings
             warningIntervals.forEach(clearTimeout);
@@ -445,7 +809,7 @@ export class RedditScraper {
             warningIntervals.forEach(clearTimeout);
 
             // If aborted due to smart switch, retry with new proxy
-            if (error.name === 'AbortError' && this.proxyManager && retryCount < maxRetries) {
+            if (requestAborted && retryCount < maxRetries) {
               this.log(
                 `🔄 Retrying page ${page} with new proxy after smart switch (attempt ${retryCount + 2}/${maxRetries + 1})`,
                 'info',
@@ -477,6 +841,7 @@ export class RedditScraper {
           }
         } catch (error: any) {
           lastError = error;
+          this.rateController.recordOtherError();
 
           // If this is the last retry, break and handle error below
           if (retryCount >= maxRetries) {
@@ -526,20 +891,15 @@ export class RedditScraper {
             subreddit,
             page,
             proxyId: this.currentProxy?.id,
-            possibleReasons: [
-              'Proxy IP blocked by Reddit',
-              'Private subreddit',
-              'Banned subreddit',
-            ],
+            possibleReasons: LISTING_FORBIDDEN_REASONS,
           });
 
           // Mark current proxy as failed and try switching
-          if (this.proxyManager && this.currentProxy?.id && retryCount < maxRetries) {
-            this.proxyManager.markProxyFailed(
-              this.currentProxy.id,
+          if (this.proxyManager && requestProxyId && retryCount < maxRetries) {
+            const switched = this.rotateProxyFrom(
+              requestProxyId,
               '403 Forbidden - IP likely blocked',
             );
-            const switched = this.switchToNextProxy('403 Forbidden');
             if (switched) {
               this.log(
                 `🔄 Switching proxy after 403 (page ${page}, attempt ${retryCount + 2}/${maxRetries + 1})`,
@@ -570,17 +930,17 @@ export class RedditScraper {
               : null,
           });
 
-          // Mark current proxy as failed
-          if (this.proxyManager && this.currentProxy?.id) {
-            this.proxyManager.markProxyFailed(
-              this.currentProxy.id,
-              '407 Proxy Authentication Required',
-            );
+          // Mark the proxy as failed, unless another request already switched away from it
+          if (this.proxyManager && requestProxyId && requestProxyId === this.currentProxy?.id) {
+            this.proxyManager.markProxyFailed(requestProxyId, '407 Proxy Authentication Required');
           }
 
           // Try switching proxy if available
           if (this.proxyManager && retryCount < maxRetries) {
-            const switched = this.switchToNextProxy('407 Proxy Authentication Required');
+            const switched = this.rotateProxyFrom(
+              requestProxyId,
+              '407 Proxy Authentication Required',
+            );
             if (switched) {
               this.log(
                 `🔄 Retrying page ${page} with new proxy (attempt ${retryCount + 2}/${maxRetries + 1})`,
@@ -602,14 +962,15 @@ export class RedditScraper {
           );
         }
         if (status === 429) {
-          const retryAfter = parseInt(lastError?.response?.headers['retry-after'] || '60', 10);
-          this.log(`Rate limited (429). Waiting ${retryAfter}s before retry...`, 'warn', {
-            retryAfter,
+          this.checkRateLimitRetries(rateLimitRetries, maxRetries, page);
+          rateLimitRetries++;
+          const outcome = this.handleRateLimit(lastError?.response?.headers);
+          this.log(rateLimitMessage(outcome), 'warn', {
+            ...outcome,
             page,
+            attempt: rateLimitRetries,
             headers: lastError?.response?.headers,
           });
-          await this.delay(retryAfter * 1000);
-          this.log(`Rate limit wait completed, retrying page ${page}...`, 'info');
           continue;
         }
 
@@ -618,8 +979,9 @@ export class RedditScraper {
           const elapsed = lastError.elapsed || lastError.config?.timeout || 20000;
 
           // Try switching proxy if available
-          if (this.proxyManager && this.currentProxy?.id && retryCount < maxRetries) {
-            const switched = this.switchToNextProxy(
+          if (this.proxyManager && requestProxyId && retryCount < maxRetries) {
+            const switched = this.rotateProxyFrom(
+              requestProxyId,
               `Timeout after ${(elapsed / 1000).toFixed(1)}s`,
             );
             if (switched) {
@@ -645,21 +1007,7 @@ export class RedditScraper {
               elapsed: `${(elapsed / 1000).toFixed(1)}s`,
               attempts: maxRetries + 1,
               url: lastError.config?.url,
-              possibleReasons: [
-                'Network too slow',
-                'Reddit server not responding',
-                'Proxy timeout',
-                'DNS resolution timeout',
-                'Firewall blocking',
-                'Reddit blocking requests',
-              ],
-              suggestions: [
-                'Check internet connection',
-                'Try using proxy (enable proxy in task form)',
-                'Check if Reddit is accessible (visit reddit.com in browser)',
-                'Check firewall/antivirus settings',
-                'Try again later',
-              ],
+              ...TIMEOUT_HINTS,
             },
           );
           throw new Error(
@@ -672,8 +1020,7 @@ export class RedditScraper {
             code: lastError.code,
             message: lastError.message,
             attempts: maxRetries + 1,
-            possibleReasons: ['DNS failure', 'Server unreachable', 'Proxy issue'],
-            suggestions: ['Try using proxy', 'Check DNS settings', 'Check network connection'],
+            ...NETWORK_HINTS,
           });
           throw new Error(`Network error after ${maxRetries + 1} attempts: ${lastError.message}`);
         }
@@ -687,9 +1034,23 @@ export class RedditScraper {
         );
       }
 
+      // 429 passes validateStatus, so it arrives as a response rather than an error
+      if (response.status === 429) {
+        this.checkRateLimitRetries(rateLimitRetries, maxRetries, page);
+        rateLimitRetries++;
+        const outcome = this.handleRateLimit(response.headers);
+        this.log(rateLimitMessage(outcome), 'warn', {
+          ...outcome,
+          page,
+          attempt: rateLimitRetries,
+          rateLimit: this.rateController.getStats(),
+        });
+        continue;
+      }
+
       // Successfully got response, process it
       try {
-        this.log(`✅ HTTP request completed successfully`, 'info', {
+        this.log(`✅ HTTP request completed successfully`, 'debug', {
           status: response.status || 'N/A',
           statusText: response.statusText || 'N/A',
           responseSize: JSON.stringify(response.data).length,
@@ -706,12 +1067,11 @@ export class RedditScraper {
           });
 
           // Mark proxy as failed and switch
-          if (this.proxyManager && this.currentProxy?.id && retryCount < maxRetries) {
-            this.proxyManager.markProxyFailed(
-              this.currentProxy.id,
+          if (this.proxyManager && requestProxyId && retryCount < maxRetries) {
+            const switched = this.rotateProxyFrom(
+              requestProxyId,
               '403 Forbidden - IP blocked by Reddit',
             );
-            const switched = this.switchToNextProxy('403 Forbidden');
             if (switched) {
               this.log(
                 `🔄 Switching proxy after 403 (page ${page}, attempt ${retryCount + 2}/${maxRetries + 1})`,
@@ -729,7 +1089,7 @@ export class RedditScraper {
           throw new Error(`Access forbidden to r/${subreddit}`);
         }
 
-        this.log(`Parsing response data...`, 'info', {
+        this.log(`Parsing response data...`, 'debug', {
           kind: response.data.kind,
           hasData: !!response.data.data,
         });
@@ -742,9 +1102,12 @@ export class RedditScraper {
           });
           throw new Error(`Invalid response format: expected Listing, got ${response.data.kind}`);
         }
+        if (!fromCache) {
+          listingCache.set(cacheKey, slimListing(response.data), LISTING_CACHE_TTL_MS[sort]);
+        }
 
         const children = response.data.data.children;
-        this.log(`Response contains ${children.length} children`, 'info', {
+        this.log(`Response contains ${children.length} children`, 'debug', {
           childrenCount: children.length,
           after: response.data.data.after,
           dist: response.data.data.dist,
@@ -754,7 +1117,7 @@ export class RedditScraper {
           this.log('No more posts available (empty children array)', 'info', {
             after,
             page,
-            totalFound: posts.length,
+            totalFound: posts.size,
             reason: 'Reached end of subreddit or no more posts',
           });
           break;
@@ -766,43 +1129,47 @@ export class RedditScraper {
           if (child.kind === 't3') {
             t3Count++;
             const post = child.data as RedditPost;
+            if (posts.has(post.id)) continue;
             // Use permalink instead of url - permalink is always the Reddit post link
             // url can be external links, images, videos, etc.
             const postUrl = post.permalink.startsWith('http')
               ? post.permalink
-              : `https://www.reddit.com${post.permalink}`;
-            posts.push({ url: postUrl, id: post.id });
+              : REDDIT_ORIGIN + post.permalink;
+            posts.set(post.id, { url: postUrl, id: post.id });
           } else {
             otherKindCount++;
-            this.log(`Skipping non-post child`, 'info', {
+            this.log(`Skipping non-post child`, 'debug', {
               kind: child.kind,
               totalSkipped: otherKindCount,
             });
           }
         }
 
-        this.log(`Processed children from page ${page}`, 'info', {
+        this.log(`Processed children from page ${page}`, 'debug', {
           totalChildren: children.length,
           postsFound: t3Count,
           otherKinds: otherKindCount,
-          totalPostsSoFar: posts.length,
+          totalPostsSoFar: posts.size,
         });
 
-        this.emitProgress(posts.length, limit, `Found ${posts.length}/${limit} posts`);
-        this.log(`Page ${page}: Found ${posts.length}/${limit} posts`);
+        this.emitProgress(posts.size, limit, `Found ${posts.size}/${limit} posts`);
+        this.log(`Page ${page}: Found ${posts.size}/${limit} posts`);
 
-        // Mark proxy as successful if using proxy
-        if (this.proxyManager && this.currentProxy?.id) {
-          this.proxyManager.markProxySuccess(this.currentProxy.id);
+        // A cache hit says nothing about Reddit or the proxy, so it must not feed the
+        // rate controller's AIMD increase or the proxy's health score
+        if (!fromCache) {
+          this.rateController.recordSuccess();
+          this.recordQuota(response.headers);
+          if (this.proxyManager && this.currentProxy?.id) {
+            this.proxyManager.markProxySuccess(this.currentProxy.id);
+          }
         }
 
         after = response.data.data.after;
         if (!after) break;
 
         page++;
-        if (posts.length < limit) {
-          await this.delay(2000); // 2s between pages
-        }
+        rateLimitRetries = 0;
       } catch (error: any) {
         await this.checkCancel();
 
@@ -837,20 +1204,15 @@ export class RedditScraper {
             subreddit,
             page,
             proxyId: this.currentProxy?.id,
-            possibleReasons: [
-              'Proxy IP blocked by Reddit',
-              'Private subreddit',
-              'Banned subreddit',
-            ],
+            possibleReasons: LISTING_FORBIDDEN_REASONS,
           });
 
           // Mark current proxy as failed and try switching
-          if (this.proxyManager && this.currentProxy?.id) {
-            this.proxyManager.markProxyFailed(
-              this.currentProxy.id,
+          if (this.proxyManager && requestProxyId) {
+            const switched = this.rotateProxyFrom(
+              requestProxyId,
               '403 Forbidden - IP likely blocked',
             );
-            const switched = this.switchToNextProxy('403 Forbidden');
             if (switched) {
               this.log(`🔄 Switching proxy after 403 (page ${page})`, 'info', {
                 page,
@@ -864,14 +1226,15 @@ export class RedditScraper {
           throw new Error(`Access forbidden to r/${subreddit}`);
         }
         if (status === 429) {
-          const retryAfter = parseInt(error.response?.headers['retry-after'] || '60', 10);
-          this.log(`Rate limited (429). Waiting ${retryAfter}s before retry...`, 'warn', {
-            retryAfter,
+          this.checkRateLimitRetries(rateLimitRetries, maxRetries, page);
+          rateLimitRetries++;
+          const outcome = this.handleRateLimit(error.response?.headers);
+          this.log(rateLimitMessage(outcome), 'warn', {
+            ...outcome,
             page,
+            attempt: rateLimitRetries,
             headers: error.response?.headers,
           });
-          await this.delay(retryAfter * 1000);
-          this.log(`Rate limit wait completed, retrying page ${page}...`, 'info');
           continue;
         }
 
@@ -883,21 +1246,7 @@ export class RedditScraper {
             elapsed: `${(elapsed / 1000).toFixed(1)}s`,
             attempts: maxRetries + 1,
             url: lastError.config?.url,
-            possibleReasons: [
-              'Network too slow',
-              'Reddit server not responding',
-              'Proxy timeout',
-              'DNS resolution timeout',
-              'Firewall blocking',
-              'Reddit blocking requests',
-            ],
-            suggestions: [
-              'Check internet connection',
-              'Try using proxy (enable proxy in task form)',
-              'Check if Reddit is accessible (visit reddit.com in browser)',
-              'Check firewall/antivirus settings',
-              'Try again later',
-            ],
+            ...TIMEOUT_HINTS,
           });
           throw new Error(
             `Request timeout after ${maxRetries + 1} attempts (${(elapsed / 1000).toFixed(1)}s each): ${lastError.message}`,
@@ -909,8 +1258,7 @@ export class RedditScraper {
             code: lastError.code,
             message: lastError.message,
             attempts: maxRetries + 1,
-            possibleReasons: ['DNS failure', 'Server unreachable', 'Proxy issue'],
-            suggestions: ['Try using proxy', 'Check DNS settings', 'Check network connection'],
+            ...NETWORK_HINTS,
           });
           throw new Error(`Network error after ${maxRetries + 1} attempts: ${lastError.message}`);
         }
@@ -925,7 +1273,75 @@ export class RedditScraper {
       }
     }
 
-    return posts.slice(0, limit);
+    return Array.from(posts.values()).slice(0, limit);
+  }
+
+  /**
+   * Fetch post lists for several sorts concurrently and merge them by post ID.
+   * Pages within one sort still chain on the `after` cursor; the shared rate
+   * controller keeps the combined request rate in check.
+   *
+   * The round-robin merge only takes about limit / sorts.length posts from each
+   * sort, so every sort is first asked for just that share. Sorts are only paged
+   * further when overlap between them leaves the merge short of `limit`.
+   */
+  async fetchPostListMulti(
+    subreddit: string,
+    limit: number,
+    sorts: RedditSort[],
+  ): Promise<Array<{ url: string; id: string }>> {
+    const share = Math.ceil(limit / sorts.length);
+    const lists = await this.fetchSortLists(subreddit, share, sorts);
+    let merged = mergeRoundRobin(lists, limit);
+
+    if (merged.length < limit) {
+      // Only sorts that filled their share can have more to give
+      const deeper = lists.flatMap((list, i) => (list && list.length >= share ? [i] : []));
+      if (deeper.length > 0) {
+        const deeperSorts = deeper.map((i) => sorts[i]);
+        this.log(`Sorts overlap (${merged.length}/${limit} unique), paging deeper`, 'info', {
+          sorts: deeperSorts,
+        });
+        try {
+          const more = await this.fetchSortLists(subreddit, limit, deeperSorts);
+          deeper.forEach((listIndex, i) => {
+            lists[listIndex] = more[i] ?? lists[listIndex];
+          });
+          merged = mergeRoundRobin(lists, limit);
+        } catch (error: any) {
+          // Keep the first pass rather than failing the whole listing
+          this.log(`Deeper listing pass failed: ${error.message}`, 'warn');
+        }
+      }
+    }
+
+    this.log(`Merged ${merged.length} unique posts from sorts: ${sorts.join(', ')}`);
+    return merged;
+  }
+
+  /**
+   * fetchPostList for each sort concurrently. Results line up with `sorts`; a sort
+   * that failed is null, and if every sort failed the first error is rethrown.
+   */
+  private async fetchSortLists(
+    subreddit: string,
+    limit: number,
+    sorts: RedditSort[],
+  ): Promise<Array<Array<{ url: string; id: string }> | null>> {
+    const results = await Promise.allSettled(
+      sorts.map((sort) => this.fetchPostList(subreddit, limit, sort)),
+    );
+    await this.checkCancel();
+
+    const lists = results.map((result, i) => {
+      if (result.status === 'fulfilled') return result.value;
+      this.log(`Listing for sort "${sorts[i]}" failed: ${result.reason?.message}`, 'warn');
+      return null;
+    });
+    if (lists.every((list) => list === null)) {
+      throw (results[0] as PromiseRejectedResult).reason;
+    }
+    return lists;
   }
 
   /**
@@ -937,35 +1353,41 @@ export class RedditScraper {
     // Extract post ID from Reddit permalink format: /r/subreddit/comments/{id}/title/
     // or handle full URL
     let postId = 'unknown';
-    const permalinkMatch = postUrl.match(/\/comments\/([^/]+)/);
+    const permalinkMatch = POST_ID_PATTERN.exec(postUrl);
     if (permalinkMatch) {
       postId = permalinkMatch[1];
     } else {
       postId = postUrl.split('/').filter(Boolean).pop() || 'unknown';
     }
 
+    // Only a bare permalink identifies one thread view; query strings can reorder comments
+    const cacheKey = permalinkMatch && !postUrl.includes('?') ? postId : undefined;
+    const cached = cacheKey ? postCache.get(cacheKey) : undefined;
+    if (cached) {
+      this.log(`Post ${postId} served from post cache`, 'debug');
+      return copyThread(cached);
+    }
+
     this.log(`Fetching post: ${postId}`);
 
-    // Ensure URL ends with .json for Reddit API
-    // Remove trailing slash and add .json
-    let jsonUrl = postUrl.replace(/\/$/, '');
-    if (!jsonUrl.endsWith('.json')) {
-      jsonUrl = jsonUrl.includes('?') ? jsonUrl.replace('?', '.json?') : `${jsonUrl}.json`;
-    }
+    const jsonUrl = toPostJsonUrl(postUrl);
 
     for (let attempt = 0; attempt < 3; attempt++) {
       await this.checkCancel();
 
-      this.log(`Fetching post attempt ${attempt + 1}/3`, 'info', {
+      this.log(`Fetching post attempt ${attempt + 1}/3`, 'debug', {
         postId,
         url: jsonUrl,
         attempt: attempt + 1,
       });
 
+      await this.throttle();
+
+      const requestProxyId = this.currentProxy?.id;
       const fetchStartTime = Date.now();
       try {
-        // Check if using proxy via httpsAgent or currentProxy
-        const isUsingProxy = !!(this.client.defaults.httpsAgent || this.currentProxy);
+        // Direct mode also sets an httpsAgent (keep-alive pool), so check currentProxy
+        const isUsingProxy = !!this.currentProxy;
         const proxyInfo =
           isUsingProxy && this.currentProxy
             ? {
@@ -977,7 +1399,7 @@ export class RedditScraper {
               }
             : { usingProxy: false, connectionMode: 'direct' };
 
-        this.log(`Making HTTP GET request...`, 'info', {
+        this.log(`Making HTTP GET request...`, 'debug', {
           url: jsonUrl,
           timeout: '60s',
           timestamp: new Date().toISOString(),
@@ -986,6 +1408,7 @@ export class RedditScraper {
 
         // Smart timeout handling: cancel and switch proxy if slow
         const timeoutWarnings: NodeJS.Timeout[] = [];
+        const requestController = new AbortController();
         let requestAborted = false;
 
         // 5s warning
@@ -1008,7 +1431,7 @@ export class RedditScraper {
             timeoutWarnings.forEach((timeout) => clearTimeout(timeout));
 
             // On attempts 0-1, switch proxy and retry
-            if (this.proxyManager && this.currentProxy?.id && attempt < 2) {
+            if (this.proxyManager && requestProxyId && attempt < 2) {
               this.log(
                 `🔄 Smart switch: Post fetch too slow (${(elapsed / 1000).toFixed(1)}s), switching proxy immediately`,
                 'warn',
@@ -1016,21 +1439,18 @@ export class RedditScraper {
                   postId,
                   elapsed: `${(elapsed / 1000).toFixed(1)}s`,
                   attempt: attempt + 1,
-                  previousProxy: this.currentProxy.id,
+                  previousProxy: requestProxyId,
                   reason: 'slow_response_8s',
                 },
               );
 
-              // Abort current request
-              this.abortController.abort();
+              // Abort only this request; other posts in flight keep going
+              requestController.abort();
               requestAborted = true;
 
-              // Mark proxy as failed and switch
-              this.proxyManager.markProxyFailed(
-                this.currentProxy.id,
-                `Slow response: ${(elapsed / 1000).toFixed(1)}s`,
-              );
-              const switched = this.switchToNextProxy(
+              // Marks the proxy as failed, unless another request already switched away
+              const switched = this.rotateProxyFrom(
+                requestProxyId,
                 `Slow response: ${(elapsed / 1000).toFixed(1)}s`,
               );
 
@@ -1065,7 +1485,7 @@ export class RedditScraper {
               },
             );
 
-            this.abortController.abort();
+            requestController.abort();
             requestAborted = true;
           }
         }, 15000); // Give up after 15s on last attempt
@@ -1073,32 +1493,34 @@ export class RedditScraper {
 
         let response;
         try {
-          response = await this.client.get<RedditThing[]>(jsonUrl);
+          response = await this.client.get<RedditThing[]>(jsonUrl, {
+            signal: this.requestSignal(requestController),
+          });
           // Clear all timeout warnings on success
           timeoutWarnings.forEach((timeout) => clearTimeout(timeout));
         } catch (error: any) {
           // Clear all timeout warnings on error
           timeoutWarnings.forEach((timeout) => clearTimeout(timeout));
 
-          // If aborted due to smart switch, retry with new proxy
-          const isAborted =
-            error.name === 'AbortError' ||
-            error.name === 'CanceledError' ||
-            error.code === 'ERR_CANCELED';
-
-          if (isAborted && this.proxyManager && attempt < 2) {
-            this.log(
-              `🔄 Retrying with new proxy after smart switch (attempt ${attempt + 2}/3)`,
-              'info',
-              {
-                postId,
-                attempt: attempt + 2,
-                reason: 'smart_switch_retry',
-                errorName: error.name,
-                errorCode: error.code,
-              },
-            );
-            continue; // Retry with new proxy
+          // Our own timers aborted it: retry after a smart switch, give up after the
+          // last-attempt timeout. A job cancellation leaves requestAborted false.
+          if (requestAborted) {
+            if (attempt < 2) {
+              this.log(
+                `🔄 Retrying with new proxy after smart switch (attempt ${attempt + 2}/3)`,
+                'info',
+                {
+                  postId,
+                  attempt: attempt + 2,
+                  reason: 'smart_switch_retry',
+                  errorName: error.name,
+                  errorCode: error.code,
+                },
+              );
+              continue; // Retry with new proxy
+            }
+            const elapsed = Date.now() - fetchStartTime;
+            throw new Error(`Post fetch timed out after ${(elapsed / 1000).toFixed(1)}s`);
           }
 
           throw error;
@@ -1106,7 +1528,7 @@ export class RedditScraper {
 
         const fetchDuration = Date.now() - fetchStartTime;
 
-        this.log(`HTTP GET completed`, 'info', {
+        this.log(`HTTP GET completed`, 'debug', {
           status: response.status,
           duration: `${fetchDuration}ms`,
           dataLength: Array.isArray(response.data) ? response.data.length : 'N/A',
@@ -1123,12 +1545,11 @@ export class RedditScraper {
           });
 
           // Mark proxy as failed and switch
-          if (this.proxyManager && this.currentProxy?.id && attempt < 2) {
-            this.proxyManager.markProxyFailed(
-              this.currentProxy.id,
+          if (this.proxyManager && requestProxyId && attempt < 2) {
+            const switched = this.rotateProxyFrom(
+              requestProxyId,
               '403 Forbidden - IP blocked by Reddit',
             );
-            const switched = this.switchToNextProxy('403 Forbidden');
             if (switched) {
               this.log(`🔄 Switching proxy after 403 (attempt ${attempt + 2}/3)`, 'info', {
                 postId,
@@ -1142,10 +1563,9 @@ export class RedditScraper {
         }
 
         if (response.status === 429) {
-          const retryAfter = parseInt(response.headers['retry-after'] || '60', 10);
+          const outcome = this.handleRateLimit(response.headers);
           if (attempt < 2) {
-            this.log(`Rate limited. Waiting ${retryAfter}s...`, 'warn');
-            await this.delay(retryAfter * 1000);
+            this.log(rateLimitMessage(outcome), 'warn', { postId, attempt: attempt + 1 });
             continue;
           }
           throw new Error('Rate limited');
@@ -1167,38 +1587,11 @@ export class RedditScraper {
           throw new Error('Invalid post format');
         }
 
-        const post = postThing.data as RedditPost;
-        const comments: FlattenedComment[] = [];
-
-        const processComments = (listing: RedditListing) => {
-          for (const child of listing.data.children) {
-            if (child.kind === 't1') {
-              const c = child.data as RedditComment;
-              comments.push({
-                id: c.id,
-                author: c.author,
-                body: c.body,
-                score: c.score,
-                created_utc: c.created_utc,
-                depth: c.depth || 0,
-                parent_id: c.parent_id,
-                permalink: c.permalink,
-                is_submitter: c.is_submitter,
-                gilded: c.gilded,
-                controversiality: c.controversiality,
-              });
-
-              if (c.replies && typeof c.replies === 'object' && c.replies.kind === 'Listing') {
-                processComments(c.replies as RedditListing);
-              }
-            }
-          }
-        };
-
-        if (commentListing) {
-          processComments(commentListing);
-        }
+        const post = pickPostFields(postThing.data);
+        const comments = flattenComments(commentListing);
 
+        this.rateController.recordSuccess();
+        this.recordQuota(response.headers);
         this.log(`✓ Fetched post ${postId} (${comments.length} comments)`);
 
         // Mark proxy as successful if using proxy
@@ -1206,7 +1599,9 @@ export class RedditScraper {
           this.proxyManager.markProxySuccess(this.currentProxy.id);
         }
 
-        return { post, comments };
+        const result = { post, comments };
+        if (cacheKey) postCache.set(cacheKey, copyThread(result), POST_CACHE_TTL_MS);
+        return result;
       } catch (error: any) {
         const fetchDuration = Date.now() - fetchStartTime;
         await this.checkCancel();
@@ -1228,27 +1623,16 @@ export class RedditScraper {
 
         this.log(`Post fetch attempt ${attempt + 1} failed`, 'error', errorDetails);
 
-        // Check if aborted due to smart switch - if so, retry with new proxy
+        if (errorDetails.timeout || errorDetails.networkError || error.response?.status >= 500) {
+          this.rateController.recordOtherError();
+        }
+
+        // Smart-switch aborts are retried above, so an abort that gets here is the job's
         const isAborted =
           error.name === 'AbortError' ||
           error.name === 'CanceledError' ||
           error.code === 'ERR_CANCELED';
 
-        if (isAborted && this.proxyManager && attempt < 2) {
-          this.log(
-            `🔄 Retrying with new proxy after smart switch (attempt ${attempt + 2}/3)`,
-            'info',
-            {
-              postId,
-              attempt: attempt + 2,
-              reason: 'smart_switch_retry',
-              errorName: error.name,
-              errorCode: error.code,
-            },
-          );
-          continue; // Retry with new proxy
-        }
-
         if (isAborted) {
           this.log('Post fetch was cancelled/aborted', 'warn', { postId });
           throw new Error('Request cancelled');
@@ -1266,21 +1650,15 @@ export class RedditScraper {
             postId,
             attempt: attempt + 1,
             proxyId: this.currentProxy?.id,
-            possibleReasons: [
-              'Proxy IP blocked by Reddit',
-              'Rate limited',
-              'Post removed',
-              'Private subreddit',
-            ],
+            possibleReasons: POST_FORBIDDEN_REASONS,
           });
 
           // Mark current proxy as failed and try switching
-          if (this.proxyManager && this.currentProxy?.id && attempt < 2) {
-            this.proxyManager.markProxyFailed(
-              this.currentProxy.id,
+          if (this.proxyManager && requestProxyId && attempt < 2) {
+            const switched = this.rotateProxyFrom(
+              requestProxyId,
               '403 Forbidden - IP likely blocked',
             );
-            const switched = this.switchToNextProxy('403 Forbidden');
             if (switched) {
               this.log(`🔄 Switching proxy after 403 (attempt ${attempt + 2}/3)`, 'info', {
                 postId,
@@ -1309,17 +1687,17 @@ export class RedditScraper {
               : null,
           });
 
-          // Mark current proxy as failed
-          if (this.proxyManager && this.currentProxy?.id) {
-            this.proxyManager.markProxyFailed(
-              this.currentProxy.id,
-              '407 Proxy Authentication Required',
-            );
+          // Mark the proxy as failed, unless another request already switched away from it
+          if (this.proxyManager && requestProxyId && requestProxyId === this.currentProxy?.id) {
+            this.proxyManager.markProxyFailed(requestProxyId, '407 Proxy Authentication Required');
           }
 
           // Try switching proxy if available
           if (this.proxyManager && attempt < 2) {
-            const switched = this.switchToNextProxy('407 Proxy Authentication Required');
+            const switched = this.rotateProxyFrom(
+              requestProxyId,
+              '407 Proxy Authentication Required',
+            );
             if (switched) {
               this.log(
                 `🔄 Retrying with new proxy after auth failure (attempt ${attempt + 2}/3)`,
@@ -1349,8 +1727,9 @@ export class RedditScraper {
           });
 
           // Auto-switch proxy on timeout if available
-          if (this.proxyManager && this.currentProxy?.id && attempt < 2) {
-            const switched = this.switchToNextProxy(
+          if (this.proxyManager && requestProxyId && attempt < 2) {
+            const switched = this.rotateProxyFrom(
+              requestProxyId,
               `Timeout after ${(fetchDuration / 1000).toFixed(1)}s`,
             );
             if (switched) {
@@ -1365,8 +1744,8 @@ export class RedditScraper {
 
         // Network errors - try switching proxy
         if (error.code === 'ENOTFOUND' || error.code === 'ECONNREFUSED') {
-          if (this.proxyManager && this.currentProxy?.id && attempt < 2) {
-            const switched = this.switchToNextProxy(`Network error: ${error.code}`);
+          if (this.proxyManager && requestProxyId && attempt < 2) {
+            const switched = this.rotateProxyFrom(requestProxyId, `Network error: ${error.code}`);
             if (switched) {
               this.log(
                 `🔄 Retrying with new proxy after network error (attempt ${attempt + 2}/3)`,
@@ -1387,7 +1766,7 @@ export class RedditScraper {
             code: error.code,
             message: error.message,
             attempt: attempt + 1,
-            possibleReasons: ['DNS failure', 'Server unreachable', 'Proxy issue'],
+            possibleReasons: NETWORK_HINTS.possibleReasons,
           });
         }
 
@@ -1421,7 +1800,11 @@ export class RedditScraper {
   async scrapeSubreddit(
     subreddit: string,
     limit: number,
-    sort: 'hot' | 'new' | 'top' = 'hot',
+    sort: RedditSort | RedditSort[] = 'hot',
+    options: {
+      /** Returns the subset of ids already stored; those posts are not fetched again */
+      knownPostIds?: (ids: string[]) => Promise<Set<string>>;
+    } = {},
   ): Promise<RedditScraperResult> {
     const scrapeStartTime = Date.now();
     await this.checkCancel();
@@ -1441,7 +1824,9 @@ export class RedditScraper {
         sort,
       });
       const listFetchStartTime = Date.now();
-      const postUrls = await this.fetchPostList(subreddit, limit, sort);
+      let postUrls = Array.isArray(sort)
+        ? await this.fetchPostListMulti(subreddit, limit, sort)
+        : await this.fetchPostList(subreddit, limit, sort);
       const listFetchDuration = Date.now() - listFetchStartTime;
 
       this.log(`Step 1 completed: Fetched ${postUrls.length} post URLs`, 'info', {
@@ -1452,13 +1837,7 @@ export class RedditScraper {
       if (postUrls.length === 0) {
         this.log(`No posts found for subreddit`, 'error', {
           subreddit,
-          possibleReasons: [
-            'Subreddit does not exist',
-            'Subreddit is private/banned',
-            'Network/proxy issues',
-            'Reddit API rate limiting',
-            'Invalid subreddit name',
-          ],
+          possibleReasons: EMPTY_LISTING_REASONS,
         });
         return {
           status: 'error',
@@ -1466,26 +1845,45 @@ export class RedditScraper {
         };
       }
 
+      if (options.knownPostIds) {
+        // One batched lookup instead of discovering duplicates after fetching them
+        const known = await options.knownPostIds(postUrls.map((p) => p.id));
+        if (known.size > 0) {
+          const listed = postUrls.length;
+          postUrls = postUrls.filter((p) => !known.has(p.id));
+          this.log(`Skipping ${listed - postUrls.length} already-stored posts`, 'info', {
+            listed,
+            remaining: postUrls.length,
+          });
+          if (postUrls.length === 0) {
+            return { status: 'success', posts: [], scrapedCount: 0, totalPosts: 0 };
+          }
+        }
+      }
+
+      // With POST_FETCH_CONCURRENCY requests overlapping, the controller's rate rather
+      // than round-trip time bounds throughput, so it gives the estimate
+      const rate = this.rateController.getRate();
       this.log(`Step 2: Starting to fetch post details...`, 'info', {
         totalPosts: postUrls.length,
-        estimatedTime: `${((postUrls.length * 3) / 60).toFixed(1)} minutes (assuming 3s per post)`,
+        concurrency: POST_FETCH_CONCURRENCY,
+        estimatedTime: `${(postUrls.length / rate / 60).toFixed(1)} minutes (at ${rate.toFixed(2)} requests/s)`,
       });
 
-      // Step 2: Fetch posts serially (for better cancellation)
-      const posts: Array<{ post: RedditPost; comments: FlattenedComment[] }> = [];
-      const detailsFetchStartTime = Date.now();
-
+      // Step 2: Fetch post details a few at a time. The rate controller still paces
+      // every request; this only overlaps their round-trips.
       const processingStartTime = Date.now();
-      for (let i = 0; i < postUrls.length; i++) {
+      let completed = 0;
+      let successCount = 0;
+      const fetchOne = async ({ url, id }: { url: string; id: string }) => {
         const postStartTime = Date.now();
         await this.checkCancel();
 
-        const { url, id } = postUrls[i];
-        this.log(`[${i + 1}/${postUrls.length}] Starting to process post`, 'info', {
+        this.log(`[${completed + 1}/${postUrls.length}] Starting to process post`, 'debug', {
           postId: id,
           url,
-          progress: `${i + 1}/${postUrls.length}`,
-          successCount: posts.length,
+          progress: `${completed + 1}/${postUrls.length}`,
+          successCount,
           elapsedTime: `${((Date.now() - processingStartTime) / 1000).toFixed(1)}s`,
         });
 
@@ -1494,46 +1892,41 @@ export class RedditScraper {
           const result = await this.fetchPost(url);
           const fetchDuration = Date.now() - fetchStartTime;
 
-          posts.push(result);
+          completed++;
+          successCount++;
 
           this.emitProgress(
-            posts.length,
+            successCount,
             postUrls.length,
-            `Scraped ${posts.length}/${postUrls.length} posts`,
+            `Scraped ${successCount}/${postUrls.length} posts`,
           );
-          this.log(`✓ [${i + 1}/${postUrls.length}] Post processed successfully`, 'info', {
+          this.log(`✓ [${completed}/${postUrls.length}] Post processed successfully`, 'info', {
             postId: id,
             comments: result.comments.length,
             fetchDuration: `${fetchDuration}ms`,
-            totalSuccess: posts.length,
-            totalFailed: i + 1 - posts.length,
+            totalSuccess: successCount,
+            totalFailed: completed - successCount,
           });
+          return result;
         } catch (error: any) {
+          completed++;
           const errorDuration = Date.now() - postStartTime;
-          this.log(`✗ [${i + 1}/${postUrls.length}] Post processing failed`, 'warn', {
+          this.log(`✗ [${completed}/${postUrls.length}] Post processing failed`, 'warn', {
             postId: id,
             url,
             error: error.message,
             errorType: error.name || error.code || 'Unknown',
             duration: `${errorDuration}ms`,
-            successCount: posts.length,
-            failedCount: i + 1 - posts.length,
+            successCount,
+            failedCount: completed - successCount,
             willContinue: true,
           });
           // Continue with next post
+          return null;
         }
-
-        if (i < postUrls.length - 1) {
-          const delayMs = 3000;
-          this.log(`Waiting ${delayMs}ms before next post...`, 'info', {
-            current: i + 1,
-            total: postUrls.length,
-            nextPostId: postUrls[i + 1]?.id,
-          });
-          await this.delay(delayMs);
-          this.log(`Delay completed, proceeding to next post`, 'info');
-        }
-      }
+      };
+      const results = await mapWithConcurrency(postUrls, POST_FETCH_CONCURRENCY, fetchOne);
+      const posts = results.filter((result) => result !== null);
 
       const totalProcessingTime = Date.now() - processingStartTime;
       this.log(`All posts processing completed`, 'info', {
@@ -102,6 +102,11 @@ export interface FlattenedComment {
   controversiality: number;
 }
 
+/**
+ * Listing sorts supported by the subreddit scraper
+ */
+export type RedditSort = 'hot' | 'new' | 'top';
+
 /**
  * Scraper configuration options
  */
@@ -56,7 +56,10 @@ export class ProxyManager {
       return;
     }
 
-    const files = fs.readdirSync(this.proxyDir).filter((f) => f.endsWith('.txt'));
+    const files = fs
+      .readdirSync(this.proxyDir, { withFileTypes: true })
+      .filter((e) => e.isFile() && e.name.endsWith('.txt'))
+      .map((e) => e.name);
 
     for (const file of files) {
       await this.loadProxiesFromFile(path.join(this.proxyDir, file));
@@ -21,6 +21,7 @@ export interface ScrapeJobData {
     subreddit?: string;
     postUrl?: string;
     strategy?: string;
+    skipExisting?: boolean; // Don't re-fetch posts already in the database
 
     // Common options
     enableRotation?: boolean;
@@ -6,11 +6,13 @@
  * Components:
  * - GlobalRateLimiter: Redis-based sliding window limiter.
  * - RateLimitManager: Session rotation and error handling.
+ * - AdaptiveRateController: Local token bucket with AIMD rate adaptation.
+ * - RateControllerRegistry: Per-key (proxy + host) controllers.
  */
 
 import { Redis } from 'ioredis';
 import { Page } from 'puppeteer';
-import { createEnhancedLogger } from '../utils';
+import { createEnhancedLogger, sleep } from '../utils';
 import { Session, SessionManager } from './session-manager';
 import { ScraperEventBus } from './scraper-engine.types';
 
@@ -126,3 +128,406 @@ export class RateLimitManager {
     else logger[level](msg);
   }
 }
+
+// ==========================================
+// 3. Adaptive Rate Controller (Token Bucket)
+// ==========================================
+
+export interface AdaptiveRateOptions {
+  /** Initial refill rate (requests per second) */
+  initialRate?: number;
+  /** Lower bound for the refill rate after repeated 429s */
+  rateMin?: number;
+  /** Upper bound for the refill rate */
+  rateMax?: number;
+  /** Minimum additive increase applied on success */
+  rateInc?: number;
+  /** Proportional increase applied on success */
+  alpha?: number;
+  /** Multiplicative decrease applied on 429 */
+  beta?: number;
+  /** Maximum number of tokens (burst size) */
+  capacity?: number;
+  /** Base backoff delay (ms) after a 429, doubled per consecutive 429 */
+  backoffBaseMs?: number;
+  /** Upper bound for the jittered backoff window (ms) */
+  backoffCapMs?: number;
+  /** Highest backoff exponent (window doubles per step) */
+  maxBackoffExp?: number;
+  /** How long (ms) a 429 keeps the jittered backoff active */
+  recent429WindowMs?: number;
+  /** Smoothing factor for the success-rate EWMA */
+  ewmaAlpha?: number;
+  /** Cooldown starts once the rate falls to rateMin * cooldownFactor */
+  cooldownFactor?: number;
+  /** Cooldown wait ranges (ms) indexed by consecutive 429 count */
+  cooldownTiers?: ReadonlyArray<readonly [number, number]>;
+  /** Time constant (ms) for the exponential decay of the 429 streak */
+  consecutive429DecayMs?: number;
+}
+
+export interface AdaptiveRateStats {
+  rate: number;
+  tokens: number;
+  capacity: number;
+  consecutive429s: number;
+  successRate: number;
+  inCooldown: boolean;
+}
+
+/**
+ * Adaptive token bucket for HTTP scrapers.
+ *
+ * Tokens refill at `rate` per second. Successes raise the rate additively,
+ * 429s cut it multiplicatively and drain the bucket, so the controller
+ * converges on the server's allowed rate instead of guessing fixed sleeps.
+ *
+ * After a 429 every caller also waits a "full jitter" backoff drawn from
+ * [0, min(cap, base * 2^n)], so concurrent workers don't retry in lockstep.
+ */
+export class AdaptiveRateController {
+  private tokens = 1;
+  private rate: number;
+  // Monotonic clock (performance.now) so wall-clock jumps can't skew refills
+  private lastRefill = performance.now();
+  private last429Mono = Number.NEGATIVE_INFINITY;
+  private retryAfterUntil = 0;
+  // 429 streak as of last429Mono; decays exponentially from there (see recent429s)
+  private consecutive429s = 0;
+  private backoffExp = 0;
+  private sessionRefreshedAfter429 = false;
+  // Exponentially weighted success rate; forgets old outcomes so it tracks current conditions
+  private successEwma = 1;
+  private readonly rateMin: number;
+  private readonly rateMax: number;
+  private readonly rateInc: number;
+  private readonly alpha: number;
+  private readonly beta: number;
+  private readonly capacity: number;
+  private readonly backoffBaseMs: number;
+  private readonly backoffCapMs: number;
+  private readonly maxBackoffExp: number;
+  private readonly recent429WindowMs: number;
+  private readonly ewmaAlpha: number;
+  private readonly cooldownThreshold: number;
+  private readonly cooldownTiers: ReadonlyArray<readonly [number, number]>;
+  private readonly consecutive429DecayMs: number;
+
+  static readonly MAX_BACKOFF_EXP = 6;
+  static readonly RECENT_429_WINDOW_MS = 60000;
+  static readonly EWMA_ALPHA = 0.02;
+  static readonly COOLDOWN_FACTOR = 2;
+  static readonly SESSION_REFRESH_THRESHOLD = 2;
+  static readonly CONSECUTIVE_429_DECAY_MS = 30000;
+  /** Cooldown wait range (ms) indexed by consecutive 429 count; the last tier repeats */
+  static readonly COOLDOWN_TIERS: ReadonlyArray<readonly [number, number]> = [
+    [10000, 20000],
+    [10000, 20000],
+    [10000, 20000],
+    [10000, 20000],
+    [20000, 40000],
+    [20000, 40000],
+    [40000, 60000],
+  ];
+
+  constructor(options: AdaptiveRateOptions = {}) {
+    this.rateMin = options.rateMin ?? 0.2;
+    this.rateMax = options.rateMax ?? 2;
+    this.rateInc = options.rateInc ?? 0.05;
+    this.alpha = options.alpha ?? 0.1;
+    this.beta = options.beta ?? 0.5;
+    this.capacity = options.capacity ?? 10;
+    this.backoffBaseMs = options.backoffBaseMs ?? 1000;
+    this.backoffCapMs = options.backoffCapMs ?? 30000;
+    this.maxBackoffExp = options.maxBackoffExp ?? AdaptiveRateController.MAX_BACKOFF_EXP;
+    this.recent429WindowMs =
+      options.recent429WindowMs ?? AdaptiveRateController.RECENT_429_WINDOW_MS;
+    this.ewmaAlpha = options.ewmaAlpha ?? AdaptiveRateController.EWMA_ALPHA;
+    this.cooldownThreshold =
+      this.rateMin * (options.cooldownFactor ?? AdaptiveRateController.COOLDOWN_FACTOR);
+    this.cooldownTiers = options.cooldownTiers ?? AdaptiveRateController.COOLDOWN_TIERS;
+    this.consecutive429DecayMs =
+      options.consecutive429DecayMs ?? AdaptiveRateController.CONSECUTIVE_429_DECAY_MS;
+    this.rate = Math.min(this.rateMax, Math.max(this.rateMin, options.initialRate ?? 0.5));
+  }
+
+  /**
+   * Reserve a token for the next request.
+   * Returns how long (ms) the caller must wait before sending it; 0 means go now.
+   */
+  getDelay(): number {
+    const now = performance.now();
+    const rate = this.rate;
+    let tokens = this.tokens + ((now - this.lastRefill) / 1000) * rate;
+    if (tokens > this.capacity) tokens = this.capacity;
+    tokens -= 1;
+    this.tokens = tokens;
+    this.lastRefill = now;
+
+    // The server told us when to come back; nothing goes out before that, and the
+    // bucket wait stacks on top so queued callers don't all fire when the hold ends
+    const hold = now < this.retryAfterUntil ? Math.ceil(this.retryAfterUntil - now) : 0;
+    const bucketDelay = tokens >= 0 ? 0 : Math.ceil((-tokens / rate) * 1000);
+    const backoffExp = this.backoffExp;
+    if (backoffExp === 0 || now - this.last429Mono >= this.recent429WindowMs) {
+      return hold + bucketDelay;
+    }
+
+    let backoffWindow = this.backoffBaseMs * (1 << backoffExp);
+    if (backoffWindow > this.backoffCapMs) backoffWindow = this.backoffCapMs;
+    return hold + bucketDelay + Math.floor(Math.random() * backoffWindow);
+  }
+
+  /**
+   * Wait (without blocking the event loop) until a token is granted.
+   * Pass a cancellable sleep to abort the wait when a job is stopped.
+   */
+  async acquire(sleepFn: (ms: number) => Promise<void> = sleep): Promise<void> {
+    const waitMs = this.getDelay();
+    if (waitMs > 0) await sleepFn(waitMs);
+  }
+
+  /**
+   * Like acquire, but also sits out the cooldown tier while in cooldown
+   */
+  async wait(sleepFn: (ms: number) => Promise<void> = sleep): Promise<void> {
+    const waitMs = this.getDelay() + this.getCooldownWaitTime();
+    if (waitMs > 0) await sleepFn(waitMs);
+  }
+
+  recordSuccess(): void {
+    this.recordSuccessBatch(1);
+  }
+
+  /**
+   * Apply `count` successes at once (e.g. a drained burst of responses).
+   * Equivalent to calling recordSuccess `count` times.
+   */
+  recordSuccessBatch(count: number): void {
+    if (count <= 0) return;
+    const wasInCooldown = this.isInCooldown();
+
+    // The rate hits rateMax within a few dozen steps, so this loop is bounded
+    let rate = this.rate;
+    for (let i = 0; i < count && rate < this.rateMax; i++) {
+      const step = this.alpha * rate;
+      rate += step > this.rateInc ? step : this.rateInc;
+    }
+    this.rate = rate < this.rateMax ? rate : this.rateMax;
+
+    this.consecutive429s = 0;
+    this.backoffExp = Math.max(0, this.backoffExp - count);
+    // Closed form of `count` EWMA updates towards 1
+    this.successEwma = 1 - (1 - this.successEwma) * (1 - this.ewmaAlpha) ** count;
+    if (wasInCooldown && !this.isInCooldown()) {
+      logger.info('Rate limit cooldown exited', {
+        rate: this.rate,
+        successRate: this.successEwma,
+      });
+    }
+  }
+
+  /**
+   * @param retryAfterMs Server-provided Retry-After (ms); no request is granted before it elapses
+   */
+  record429(retryAfterMs?: number): void {
+    const wasInCooldown = this.isInCooldown();
+    const rate = this.beta * this.rate;
+    this.rate = rate > this.rateMin ? rate : this.rateMin;
+    // Drain the bucket but keep outstanding reservations: callers already waiting on
+    // negative tokens must stay queued behind each other
+    if (this.tokens > 0) this.tokens = 0;
+    const now = performance.now();
+    this.consecutive429s = this.recent429s(now) + 1;
+    this.last429Mono = now;
+    if (retryAfterMs !== undefined && retryAfterMs > 0) this.holdFor(retryAfterMs, now);
+    this.sessionRefreshedAfter429 = false;
+    if (this.backoffExp < this.maxBackoffExp) this.backoffExp++;
+    this.successEwma -= this.ewmaAlpha * this.successEwma;
+    if (!wasInCooldown && this.isInCooldown()) {
+      logger.warn('Rate limit cooldown entered', {
+        rate: this.rate,
+        consecutive429s: Math.round(this.consecutive429s),
+      });
+    }
+  }
+
+  /**
+   * Hold every grant until at least `ms` from now, e.g. a cooldown pause chosen by
+   * the caller. Never shortens an existing hold.
+   */
+  holdFor(ms: number, now: number = performance.now()): void {
+    const until = now + ms;
+    if (until > this.retryAfterUntil) this.retryAfterUntil = until;
+  }
+
+  /**
+   * Apply a server-reported quota: `remaining` requests until the window resets in
+   * `resetMs`. Caps the rate at what the quota can sustain (successes still raise it
+   * additively up to that cap) and holds every grant until the reset once it's spent.
+   */
+  recordQuota(remaining: number, resetMs: number): void {
+    if (remaining < 1) {
+      this.holdFor(resetMs);
+      return;
+    }
+    if (resetMs <= 0) return;
+    const quotaRate = remaining / (resetMs / 1000);
+    if (quotaRate < this.rate) this.rate = quotaRate > this.rateMin ? quotaRate : this.rateMin;
+  }
+
+  /**
+   * Record a failure that isn't rate limiting (timeouts, 5xx).
+   * Only the success rate is affected; pacing is left to 429 handling.
+   */
+  recordOtherError(): void {
+    this.successEwma -= this.ewmaAlpha * this.successEwma;
+  }
+
+  /**
+   * True once 429s keep coming on the current session/proxy and it hasn't been
+   * rotated since the last one. Derived from the 429 streak, so it can't go stale.
+   */
+  needsSessionRefresh(): boolean {
+    return (
+      Math.round(this.recent429s()) >= AdaptiveRateController.SESSION_REFRESH_THRESHOLD &&
+      !this.sessionRefreshedAfter429
+    );
+  }
+
+  markSessionRefreshed(): void {
+    this.sessionRefreshedAfter429 = true;
+  }
+
+  /**
+   * The 429 streak decayed by time since the last 429, so an isolated burst
+   * fades out instead of counting as "recent" until the next success.
+   */
+  private recent429s(now = performance.now()): number {
+    if (this.consecutive429s === 0) return 0;
+    return this.consecutive429s * Math.exp(-(now - this.last429Mono) / this.consecutive429DecayMs);
+  }
+
+  getSuccessRate(): number {
+    return this.successEwma;
+  }
+
+  getRate(): number {
+    return this.rate;
+  }
+
+  isInCooldown(): boolean {
+    return this.rate <= this.cooldownThreshold;
+  }
+
+  /**
+   * How long (ms) to back off after a 429 when the server gives no Retry-After.
+   * Returns 0 outside cooldown; the jittered backoff in getDelay covers that case.
+   */
+  getCooldownWaitTime(): number {
+    if (!this.isInCooldown()) return 0;
+    const tiers = this.cooldownTiers;
+    const [lo, hi] = tiers[Math.min(Math.round(this.recent429s()), tiers.length - 1)];
+    return lo + Math.random() * (hi - lo);
+  }
+
+  getStats(): AdaptiveRateStats {
+    return {
+      rate: this.rate,
+      tokens: this.tokens,
+      capacity: this.capacity,
+      consecutive429s: this.recent429s(),
+      successRate: this.successEwma,
+      inCooldown: this.isInCooldown(),
+    };
+  }
+}
+
+export interface RateRegistrySummary {
+  controllers: number;
+  inCooldown: number;
+  meanRate: number;
+  meanSuccessRate: number;
+}
+
+/**
+ * Lazily creates one AdaptiveRateController per key (e.g. proxy + host),
+ * so a 429 on one route doesn't slow down traffic on the others.
+ */
+export class RateControllerRegistry {
+  private controllers = new Map<string, AdaptiveRateController>();
+
+  constructor(private options: AdaptiveRateOptions = {}) {}
+
+  get(key: string): AdaptiveRateController {
+    let controller = this.controllers.get(key);
+    if (!controller) {
+      controller = new AdaptiveRateController(this.options);
+      this.controllers.set(key, controller);
+    }
+    return controller;
+  }
+
+  get size(): number {
+    return this.controllers.size;
+  }
+
+  /**
+   * Fleet-wide roll-up computed in a single pass over the controllers
+   */
+  getSummary(): RateRegistrySummary {
+    let inCooldown = 0;
+    let rateSum = 0;
+    let successSum = 0;
+    for (const controller of this.controllers.values()) {
+      if (controller.isInCooldown()) inCooldown++;
+      rateSum += controller.getRate();
+      successSum += controller.getSuccessRate();
+    }
+    const count = this.controllers.size;
+    return {
+      controllers: count,
+      inCooldown,
+      meanRate: count ? rateSum / count : 0,
+      meanSuccessRate: count ? successSum / count : 1,
+    };
+  }
+
+  clear(): void {
+    this.controllers.clear();
+  }
+}
+
+/** Process-wide registry shared by all scrapers */
+export const rateControllerRegistry = new RateControllerRegistry();
+
+export interface RateLimitQuota {
+  remaining: number;
+  resetMs: number;
+}
+
+/**
+ * Parse X-Ratelimit-Remaining / X-Ratelimit-Reset (requests left, seconds until the
+ * window resets) as sent by Reddit. Returns undefined unless both headers are valid.
+ */
+export function parseRateLimitQuota(
+  headers: Record<string, any> | undefined | null,
+): RateLimitQuota | undefined {
+  const remaining = Number.parseFloat(headers?.['x-ratelimit-remaining']);
+  const resetSeconds = Number.parseFloat(headers?.['x-ratelimit-reset']);
+  if (!Number.isFinite(remaining) || !Number.isFinite(resetSeconds)) return undefined;
+  return { remaining, resetMs: Math.max(0, resetSeconds) * 1000 };
+}
+
+/**
+ * Parse a Retry-After header (delta-seconds or HTTP-date) into milliseconds.
+ * Returns undefined when the header is missing or malformed.
+ */
+export function parseRetryAfter(value: string | undefined | null): number | undefined {
+  if (!value) return undefined;
+  const trimmed = String(value).trim();
+  if (/^\d+$/.test(trimmed)) return parseInt(trimmed, 10) * 1000;
+  const date = Date.parse(trimmed);
+  if (Number.isNaN(date)) return undefined;
+  return Math.max(0, date - Date.now());
+}
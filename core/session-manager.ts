@@ -59,8 +59,9 @@ export class SessionManager {
       if (!fs.existsSync(this.cookieDir)) return;
 
       const files = fs
-        .readdirSync(this.cookieDir)
-        .filter((f) => f.endsWith('.json') && !f.endsWith('.meta.json'));
+        .readdirSync(this.cookieDir, { withFileTypes: true })
+        .filter((e) => e.isFile() && e.name.endsWith('.json') && !e.name.endsWith('.meta.json'))
+        .map((e) => e.name);
 
       for (const file of files) {
         try {
@@ -245,13 +246,15 @@ export class SessionManager {
    */
   async hasActiveSession(): Promise<boolean> {
     try {
-      const count = await this.prisma.cookieSession.count({
+      // Existence check: stop at the first matching row instead of counting them all
+      const session = await this.prisma.cookieSession.findFirst({
         where: {
           isValid: true,
           platform: 'twitter',
         },
+        select: { id: true },
       });
-      return count > 0;
+      return session !== null;
     } catch (error: any) {
       this._log(`Failed to check active sessions: ${error.message}`, 'error');
       return false;
@@ -19,8 +19,7 @@ const logger = createEnhancedLogger('JobRoutes');
  * List all jobs (with pagination and filtering)
  */
 jobRoutes.get('/', async (c) => {
-  console.log('DEBUG: GET / handler called!');
-  console.log('DEBUG: Query params:', c.req.query());
+  logger.debug('Listing jobs', { query: c.req.query() });
   try {
     const state = c.req.query('state');
     const type = c.req.query('type');
@@ -6,10 +6,15 @@
 
 import { Hono } from 'hono';
 import { scrapeQueue } from '../../core/queue/scrape-queue';
+import { getConfigManager } from '../../utils/config-manager';
 import { createEnhancedLogger } from '../../utils/logger';
 
 const logger = createEnhancedLogger('QueueMonitor');
 
+// BullMQ keeps one stack trace per failed attempt; they leak server paths and bloat
+// the payload, so only hand them out when the server runs with debug logging
+const exposeStackTraces = getConfigManager().getLoggingConfig().level === 'debug';
+
 const queueMonitor = new Hono();
 
 /**
@@ -137,7 +142,7 @@ queueMonitor.get('/job/:id', async (c) => {
       data: job.data,
       returnvalue: job.returnvalue,
       failedReason: job.failedReason,
-      stacktrace: job.stacktrace,
+      stacktrace: exposeStackTraces ? job.stacktrace : undefined,
       timestamp: job.timestamp,
       processedOn: job.processedOn,
       finishedOn: job.finishedOn,
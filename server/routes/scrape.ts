@@ -22,13 +22,15 @@ function normalizeUsername(input: string | undefined): string | undefined {
   return cleaned || undefined;
 }
 
+const SUBREDDIT_URL_PATTERN = /reddit\.com\/r\/([^/?#]+)/i;
+
 function parseRedditInput(input: string): { subreddit?: string; postUrl?: string } {
   if (!input) return {};
   const trimmed = input.trim();
   if (trimmed.includes('/comments/') || trimmed.includes('redd.it/')) {
     return { postUrl: trimmed };
   }
-  const subredditMatch = trimmed.match(/reddit\.com\/r\/([^/?#]+)/i);
+  const subredditMatch = SUBREDDIT_URL_PATTERN.exec(trimmed);
   if (subredditMatch) return { subreddit: subredditMatch[1] };
   return { subreddit: trimmed };
 }
@@ -42,7 +44,7 @@ scrapeRoutes.post('/scrape-v2', async (c) => {
     const body = await c.req.json();
     const {
       type, input, limit, likes, mode, dateRange,
-      enableRotation, enableProxy, strategy, antiDetectionLevel,
+      enableRotation, enableProxy, strategy, antiDetectionLevel, skipExisting,
     } = body;
 
     logger.info('Received scrape request', { type, input, limit });
@@ -77,6 +79,7 @@ scrapeRoutes.post('/scrape-v2', async (c) => {
         postUrl: parsed.postUrl,
         limit: limit || 500,
         strategy: strategy || 'auto',
+        skipExisting: skipExisting || false,
         enableProxy: enableProxy || false,
       };
     }
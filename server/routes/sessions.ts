@@ -13,19 +13,12 @@ const sessionRoutes = new Hono();
 // GET /api/sessions
 sessionRoutes.get('/sessions', async (c) => {
   try {
-    // console.log for visibility
-    console.log(`[DEBUG] Fetching sessions from DB. URL starts with: ${process.env.DATABASE_URL?.substring(0, 15)}...`);
-
     const { prisma } = await import('../../core/db/repositories');
 
-    // Debug: count before findMany
-    const count = await prisma.cookieSession.count();
-    console.log(`[DEBUG] Session count in DB: ${count}`);
-
     const dbSessions = await prisma.cookieSession.findMany({
       orderBy: { lastUsed: 'desc' }
     });
-    console.log(`[DEBUG] Fetched ${dbSessions.length} sessions from DB`);
+    logger.debug(`Fetched ${dbSessions.length} sessions from DB`);
 
     // Map to frontend expected format
     const sessions = dbSessions.map(session => {
@@ -0,0 +1,278 @@
+import { describe, expect, spyOn, test } from 'bun:test';
+import {
+  AdaptiveRateController,
+  RateControllerRegistry,
+  parseRateLimitQuota,
+  parseRetryAfter,
+} from '../../core/rate-limit';
+
+describe('AdaptiveRateController', () => {
+  test('grants the first request immediately', () => {
+    const controller = new AdaptiveRateController();
+    expect(controller.getDelay()).toBe(0);
+  });
+
+  test('paces requests once the bucket is empty', () => {
+    const controller = new AdaptiveRateController({ initialRate: 1 });
+    controller.getDelay();
+    const delay = controller.getDelay();
+    expect(delay).toBeGreaterThan(900);
+    expect(delay).toBeLessThanOrEqual(1000);
+  });
+
+  test('successes raise the rate up to rateMax', () => {
+    const controller = new AdaptiveRateController({ initialRate: 0.5, rateMax: 1 });
+    for (let i = 0; i < 50; i++) controller.recordSuccess();
+    expect(controller.getStats().rate).toBe(1);
+  });
+
+  test('batched successes match repeated single successes', () => {
+    const single = new AdaptiveRateController({ initialRate: 0.2 });
+    const batched = new AdaptiveRateController({ initialRate: 0.2 });
+    single.record429();
+    batched.record429();
+
+    for (let i = 0; i < 7; i++) single.recordSuccess();
+    batched.recordSuccessBatch(7);
+
+    expect(batched.getStats().rate).toBeCloseTo(single.getStats().rate, 10);
+    expect(batched.getSuccessRate()).toBeCloseTo(single.getSuccessRate(), 10);
+    expect(batched.getStats().consecutive429s).toBe(0);
+  });
+
+  test('429s halve the rate, drain tokens and enter cooldown', () => {
+    const controller = new AdaptiveRateController({ initialRate: 1, rateMin: 0.2 });
+    controller.record429();
+    expect(controller.getStats().rate).toBe(0.5);
+    expect(controller.getStats().tokens).toBe(0);
+    expect(controller.isInCooldown()).toBe(false);
+
+    controller.record429();
+    controller.record429();
+    expect(controller.getStats().rate).toBe(0.2);
+    expect(controller.isInCooldown()).toBe(true);
+  });
+
+  test('a 429 keeps tokens already reserved by waiting callers', () => {
+    const controller = new AdaptiveRateController({ initialRate: 1 });
+    controller.getDelay();
+    controller.getDelay();
+    controller.getDelay();
+    controller.record429();
+    expect(controller.getStats().tokens).toBeLessThan(-1);
+  });
+
+  test('429s add a full-jitter backoff that decays on success', () => {
+    const controller = new AdaptiveRateController({ initialRate: 1, backoffBaseMs: 1000 });
+    controller.record429();
+    // Bucket wait at 0.5 req/s is 2000ms, plus jitter in [0, 2000)
+    const delay = controller.getDelay();
+    expect(delay).toBeGreaterThanOrEqual(1990);
+    expect(delay).toBeLessThan(4000);
+    expect(controller.getStats().consecutive429s).toBeCloseTo(1, 3);
+
+    controller.recordSuccess();
+    expect(controller.getStats().consecutive429s).toBe(0);
+  });
+
+  test('cooldown wait time follows the consecutive 429 tiers', () => {
+    const controller = new AdaptiveRateController({ initialRate: 2, rateMin: 0.2 });
+    expect(controller.getCooldownWaitTime()).toBe(0);
+
+    for (let i = 0; i < 3; i++) controller.record429();
+    const wait = controller.getCooldownWaitTime();
+    expect(wait).toBeGreaterThanOrEqual(10000);
+    expect(wait).toBeLessThan(20000);
+
+    for (let i = 0; i < 4; i++) controller.record429();
+    expect(controller.getCooldownWaitTime()).toBeGreaterThanOrEqual(40000);
+  });
+
+  test('success rate is an EWMA that recovers after errors', () => {
+    const controller = new AdaptiveRateController();
+    expect(controller.getSuccessRate()).toBe(1);
+
+    controller.record429();
+    controller.recordOtherError();
+    const afterErrors = controller.getSuccessRate();
+    expect(afterErrors).toBeCloseTo(0.98 * 0.98, 10);
+
+    controller.recordSuccess();
+    expect(controller.getSuccessRate()).toBeGreaterThan(afterErrors);
+  });
+
+  test('tuning constants can be overridden per instance', () => {
+    const controller = new AdaptiveRateController({
+      initialRate: 1,
+      rateMin: 0.2,
+      cooldownFactor: 3,
+      cooldownTiers: [[1000, 1000]],
+    });
+    controller.record429();
+    controller.record429();
+    expect(controller.isInCooldown()).toBe(true);
+    expect(controller.getCooldownWaitTime()).toBe(1000);
+  });
+
+  test('asks for one session refresh per 429 streak', () => {
+    const controller = new AdaptiveRateController();
+    controller.record429();
+    expect(controller.needsSessionRefresh()).toBe(false);
+
+    controller.record429();
+    expect(controller.needsSessionRefresh()).toBe(true);
+    controller.markSessionRefreshed();
+    expect(controller.needsSessionRefresh()).toBe(false);
+
+    controller.recordSuccess();
+    controller.record429();
+    expect(controller.needsSessionRefresh()).toBe(false);
+  });
+
+  test('the 429 streak decays over time', () => {
+    const controller = new AdaptiveRateController({ consecutive429DecayMs: 30000 });
+    const now = performance.now();
+    const clock = spyOn(performance, 'now').mockReturnValue(now);
+    try {
+      controller.record429();
+      controller.record429();
+      expect(controller.needsSessionRefresh()).toBe(true);
+
+      clock.mockReturnValue(now + 30000);
+      expect(controller.getStats().consecutive429s).toBeCloseTo(2 / Math.E, 10);
+      expect(controller.needsSessionRefresh()).toBe(false);
+    } finally {
+      clock.mockRestore();
+    }
+  });
+
+  test('acquire sleeps through the injected sleep only when throttled', async () => {
+    const controller = new AdaptiveRateController({ initialRate: 1 });
+    const sleeps: number[] = [];
+    const fakeSleep = async (ms: number) => {
+      sleeps.push(ms);
+    };
+
+    await controller.acquire(fakeSleep);
+    expect(sleeps).toEqual([]);
+
+    await controller.acquire(fakeSleep);
+    expect(sleeps.length).toBe(1);
+    expect(sleeps[0]).toBeGreaterThan(900);
+  });
+
+  test('Retry-After holds the next grant until the server deadline', () => {
+    const controller = new AdaptiveRateController({ capacity: 10 });
+    controller.record429(5000);
+    // Hold, plus the bucket wait at 0.25 req/s (4000ms), plus jitter in [0, 2000)
+    const delay = controller.getDelay();
+    expect(delay).toBeGreaterThan(8900);
+    expect(delay).toBeLessThan(11000);
+  });
+
+  test('grants queued during a hold are spaced out after it', () => {
+    const clock = spyOn(performance, 'now').mockReturnValue(performance.now());
+    try {
+      const controller = new AdaptiveRateController({ initialRate: 1 });
+      controller.holdFor(5000);
+      const delays = [1, 2, 3, 4].map(() => controller.getDelay());
+      expect(delays).toEqual([5000, 6000, 7000, 8000]);
+    } finally {
+      clock.mockRestore();
+    }
+  });
+
+  test('holdFor extends but never shortens a pending hold', () => {
+    const controller = new AdaptiveRateController({ capacity: 10 });
+    controller.record429(5000);
+    controller.holdFor(1000);
+    expect(controller.getDelay()).toBeGreaterThan(4900);
+
+    controller.holdFor(8000);
+    expect(controller.getDelay()).toBeGreaterThan(7900);
+  });
+
+  test('a reported quota caps the rate but never raises it', () => {
+    const controller = new AdaptiveRateController({ initialRate: 1, rateMin: 0.1 });
+    controller.recordQuota(300, 600000);
+    expect(controller.getRate()).toBe(0.5);
+
+    controller.recordQuota(600, 60000);
+    expect(controller.getRate()).toBe(0.5);
+  });
+
+  test('an exhausted quota holds grants until the window resets', () => {
+    const controller = new AdaptiveRateController({ capacity: 10 });
+    controller.recordQuota(0, 5000);
+    const delay = controller.getDelay();
+    expect(delay).toBeGreaterThan(4900);
+    expect(delay).toBeLessThanOrEqual(5000);
+  });
+});
+
+describe('parseRateLimitQuota', () => {
+  test('parses remaining requests and reset seconds', () => {
+    expect(
+      parseRateLimitQuota({ 'x-ratelimit-remaining': '95.0', 'x-ratelimit-reset': '342' }),
+    ).toEqual({ remaining: 95, resetMs: 342000 });
+  });
+
+  test('returns undefined when either header is missing', () => {
+    expect(parseRateLimitQuota({ 'x-ratelimit-remaining': '95.0' })).toBeUndefined();
+    expect(parseRateLimitQuota(undefined)).toBeUndefined();
+  });
+});
+
+describe('parseRetryAfter', () => {
+  test('parses delta-seconds', () => {
+    expect(parseRetryAfter('30')).toBe(30000);
+  });
+
+  test('parses HTTP-date relative to now', () => {
+    const ms = parseRetryAfter(new Date(Date.now() + 10000).toUTCString());
+    expect(ms).toBeGreaterThan(8000);
+    expect(ms).toBeLessThanOrEqual(10000);
+  });
+
+  test('returns undefined for missing or malformed values', () => {
+    expect(parseRetryAfter(undefined)).toBeUndefined();
+    expect(parseRetryAfter('soon')).toBeUndefined();
+  });
+});
+
+describe('RateControllerRegistry', () => {
+  test('returns one controller per key', () => {
+    const registry = new RateControllerRegistry();
+    const a = registry.get('direct@www.reddit.com');
+    expect(registry.get('direct@www.reddit.com')).toBe(a);
+    expect(registry.get('proxy-1@www.reddit.com')).not.toBe(a);
+    expect(registry.size).toBe(2);
+  });
+
+  test('429s on one key leave the others untouched', () => {
+    const registry = new RateControllerRegistry({ initialRate: 1 });
+    registry.get('a').record429();
+    expect(registry.get('a').getStats().rate).toBe(0.5);
+    expect(registry.get('b').getStats().rate).toBe(1);
+  });
+
+  test('summarises every controller in one call', () => {
+    const registry = new RateControllerRegistry({ initialRate: 1, rateMin: 0.2 });
+    expect(registry.getSummary()).toEqual({
+      controllers: 0,
+      inCooldown: 0,
+      meanRate: 0,
+      meanSuccessRate: 1,
+    });
+
+    registry.get('a');
+    const b = registry.get('b');
+    b.record429();
+    b.record429();
+
+    const summary = registry.getSummary();
+    expect(summary.controllers).toBe(2);
+    expect(summary.inCooldown).toBe(1);
+    expect(summary.meanRate).toBeCloseTo(0.625, 10);
+  });
+});
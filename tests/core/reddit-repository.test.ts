@@ -0,0 +1,38 @@
+import { beforeEach, describe, expect, mock, test } from 'bun:test';
+
+// repositories.ts reuses a Prisma client already parked on globalThis instead of
+// creating its own, so handing it a stub keeps these tests off the database
+const stored = new Set<string>();
+const findMany = mock(async ({ where }: { where: { id: { in: string[] } } }) =>
+  where.id.in.filter((id) => stored.has(id)).map((id) => ({ id })),
+);
+(globalThis as any).prisma = { redditPost: { findMany } };
+
+describe('RedditRepository', () => {
+  beforeEach(() => {
+    stored.clear();
+    findMany.mockClear();
+  });
+
+  describe('getExistingPostIds', () => {
+    test('looks ids up in chunks of 1000', async () => {
+      const { RedditRepository } = await import('../../core/db/repositories');
+      const ids = Array.from({ length: 2500 }, (_, i) => `post-${i}`);
+      stored.add('post-0');
+      stored.add('post-1000');
+      stored.add('post-2499');
+
+      const existing = await RedditRepository.getExistingPostIds(ids);
+
+      const chunkSizes = findMany.mock.calls.map(([args]) => args.where.id.in.length);
+      expect(existing).toEqual(new Set(['post-0', 'post-1000', 'post-2499']));
+      expect(chunkSizes).toEqual([1000, 1000, 500]);
+    });
+
+    test('skips the query when there are no ids', async () => {
+      const { RedditRepository } = await import('../../core/db/repositories');
+      expect(await RedditRepository.getExistingPostIds([])).toEqual(new Set());
+      expect(findMany).not.toHaveBeenCalled();
+    });
+  });
+});
@@ -0,0 +1,343 @@
+import {
+  afterEach,
+  beforeEach,
+  describe,
+  expect,
+  mock,
+  setSystemTime,
+  spyOn,
+  test,
+} from 'bun:test';
+import axios from 'axios';
+import { RedditScraper } from '../../core/platforms/reddit/scraper';
+import { sleep } from '../../utils/async';
+
+const realSetTimeout = globalThis.setTimeout;
+
+function canceledError() {
+  return Object.assign(new Error('canceled'), { name: 'CanceledError', code: 'ERR_CANCELED' });
+}
+
+function postThread(id: string) {
+  return {
+    status: 200,
+    statusText: 'OK',
+    headers: {},
+    data: [
+      {
+        kind: 'Listing',
+        data: {
+          children: [
+            {
+              kind: 't3',
+              data: { id, title: `Post ${id}`, permalink: `/r/test/comments/${id}/` },
+            },
+          ],
+        },
+      },
+      { kind: 'Listing', data: { children: [] } },
+    ],
+  };
+}
+
+function listing(ids: string[], after: string | null = null) {
+  return {
+    status: 200,
+    statusText: 'OK',
+    headers: {},
+    data: {
+      kind: 'Listing',
+      data: {
+        after,
+        dist: ids.length,
+        children: ids.map((id) => ({
+          kind: 't3',
+          data: { id, permalink: `/r/test/comments/${id}/` },
+        })),
+      },
+    },
+  };
+}
+
+function postUrl(id: string) {
+  return { id, url: `https://www.reddit.com/r/test/comments/${id}/` };
+}
+
+function createProxyManager() {
+  return {
+    hasProxies: () => true,
+    getNextProxy: mock(() => ({ id: 'proxy-b', host: '10.0.0.2', port: 8080 })),
+    markProxyFailed: mock((_id: string, _reason?: string) => {}),
+    markProxySuccess: mock(() => {}),
+  };
+}
+
+// Run the slow-request timers 20x faster: the 8s smart switch fires after 400ms
+function speedUpSlowRequestTimers() {
+  return spyOn(globalThis, 'setTimeout').mockImplementation(((
+    fn: (...args: any[]) => void,
+    ms?: number,
+    ...args: any[]
+  ) => realSetTimeout(fn, ms && ms >= 5000 ? ms / 20 : ms, ...args)) as any);
+}
+
+describe('RedditScraper', () => {
+  let client: { get: ReturnType<typeof mock> };
+  let createSpy: ReturnType<typeof spyOn>;
+
+  beforeEach(() => {
+    client = { get: mock(() => Promise.reject(new Error('unexpected request'))) };
+    // switchToNextProxy builds a new client, so every client must be the fake one
+    createSpy = spyOn(axios, 'create').mockReturnValue(client as any);
+  });
+
+  afterEach(() => {
+    createSpy.mockRestore();
+  });
+
+  function createScraper(proxyManager?: ReturnType<typeof createProxyManager>) {
+    const eventBus = { emitLog: mock(() => {}), emitProgress: mock(() => {}) };
+    const scraper = new RedditScraper(
+      proxyManager ? { host: '10.0.0.1', port: 8080, id: `proxy-a-${Math.random()}` } : undefined,
+      eventBus as any,
+      undefined,
+      proxyManager,
+    );
+    (scraper as any).throttle = async () => {};
+    return scraper;
+  }
+
+  describe('fetchPostList', () => {
+    test('gives up on a page that keeps returning 429', async () => {
+      const scraper = createScraper();
+      client.get.mockImplementation(async () => ({
+        status: 429,
+        statusText: 'Too Many Requests',
+        headers: { 'retry-after': '1' },
+        data: {},
+      }));
+
+      await expect(scraper.fetchPostList('ratelimited', 10, 'hot')).rejects.toThrow(
+        'Rate limited (429) fetching page 1 after 4 attempts',
+      );
+      expect(client.get).toHaveBeenCalledTimes(4);
+    });
+  });
+
+  describe('handleRateLimit', () => {
+    test('holds for a streak backoff when a 429 has no Retry-After outside cooldown', () => {
+      const scraper = createScraper(createProxyManager());
+      const controller = (scraper as any).rateController;
+      // Climb to the top rate so a single 429 doesn't drop into cooldown
+      controller.recordSuccessBatch(50);
+
+      expect((scraper as any).handleRateLimit({})).toEqual({ switched: false, waitMs: 5000 });
+      expect(controller.getDelay()).toBeGreaterThan(4900);
+    });
+
+    test('reports Retry-After: 0 as a retry without switching proxy', () => {
+      const scraper = createScraper(createProxyManager());
+      const outcome = (scraper as any).handleRateLimit({ 'retry-after': '0' });
+      expect(outcome).toEqual({ switched: false, waitMs: 0 });
+    });
+
+    test('reports a proxy switch once 429s keep coming', () => {
+      const proxyManager = createProxyManager();
+      const scraper = createScraper(proxyManager);
+      (scraper as any).handleRateLimit({ 'retry-after': '1' });
+
+      expect((scraper as any).handleRateLimit({ 'retry-after': '1' })).toEqual({
+        switched: true,
+        waitMs: 0,
+      });
+      expect(proxyManager.getNextProxy).toHaveBeenCalledTimes(1);
+    });
+  });
+
+  describe('listing cache', () => {
+    afterEach(() => {
+      setSystemTime();
+    });
+
+    test('reuses a listing page until its sort TTL expires', async () => {
+      const start = new Date('2024-01-01T00:00:00Z');
+      setSystemTime(start);
+      const scraper = createScraper();
+      client.get.mockImplementation(async () => listing(['cached-1', 'cached-2']));
+
+      const first = await scraper.fetchPostList('listingcache', 2, 'new');
+      const second = await scraper.fetchPostList('listingcache', 2, 'new');
+      expect(second).toEqual(first);
+      expect(client.get).toHaveBeenCalledTimes(1);
+
+      // Pages of the new sort are cached for 60s
+      setSystemTime(new Date(start.getTime() + 59 * 1000));
+      await scraper.fetchPostList('listingcache', 2, 'new');
+      expect(client.get).toHaveBeenCalledTimes(1);
+
+      setSystemTime(new Date(start.getTime() + 60 * 1000));
+      await scraper.fetchPostList('listingcache', 2, 'new');
+      expect(client.get).toHaveBeenCalledTimes(2);
+    });
+  });
+
+  describe('fetchPostListMulti', () => {
+    test('merges sorts round-robin and drops duplicates', async () => {
+      const scraper = createScraper();
+      const bySort: Record<string, string[]> = {
+        hot: ['multi-h1', 'multi-s1'],
+        new: ['multi-s1', 'multi-n2'],
+        top: ['multi-t1', 'multi-h1'],
+      };
+      client.get.mockImplementation(async (url: string) => {
+        const sort = /\/(\w+)\.json$/.exec(url)?.[1] as string;
+        return listing(bySort[sort]);
+      });
+
+      const merged = await scraper.fetchPostListMulti('multisort', 4, ['hot', 'new', 'top']);
+
+      expect(merged.map((p) => p.id)).toEqual(['multi-h1', 'multi-s1', 'multi-t1', 'multi-n2']);
+      // limit 4 over 3 sorts asks each sort for 2, and the merge fills without paging deeper
+      expect(client.get).toHaveBeenCalledTimes(3);
+      for (const [, config] of client.get.mock.calls) expect(config.params.limit).toBe(2);
+    });
+
+    test('a slow sort switching proxy does not cancel the other sorts', async () => {
+      const timers = speedUpSlowRequestTimers();
+      try {
+        const proxyManager = createProxyManager();
+        const scraper = createScraper(proxyManager);
+
+        // hot starts first and stalls; new and top start 200ms later and are still in
+        // flight when hot hits the smart switch. hot then retries without backoff.
+        let throttled = 0;
+        (scraper as any).throttle = async () => {
+          const call = throttled++;
+          if (call === 1 || call === 2) await sleep(200);
+        };
+        (scraper as any).delay = async () => {};
+
+        const signals = new Map<string, AbortSignal[]>();
+        client.get.mockImplementation((url: string, config: { signal: AbortSignal }) => {
+          const sort = /\/(\w+)\.json$/.exec(url)?.[1] as string;
+          const seen = signals.get(sort) ?? [];
+          seen.push(config.signal);
+          signals.set(sort, seen);
+
+          if (sort === 'hot') {
+            if (seen.length > 1) return Promise.resolve(listing(['slowsort-hot']));
+            return new Promise((_, reject) => {
+              config.signal.addEventListener('abort', () => reject(canceledError()));
+            });
+          }
+          return sleep(300).then(() =>
+            config.signal.aborted ? Promise.reject(canceledError()) : listing([`slowsort-${sort}`]),
+          );
+        });
+
+        const merged = await scraper.fetchPostListMulti('slowsort', 3, ['hot', 'new', 'top']);
+
+        expect(merged.map((p) => p.id)).toEqual(['slowsort-hot', 'slowsort-new', 'slowsort-top']);
+        expect(signals.get('hot')?.length).toBe(2);
+        for (const sort of ['new', 'top']) {
+          expect(signals.get(sort)?.length).toBe(1);
+          expect(signals.get(sort)?.[0].aborted).toBe(false);
+        }
+        expect(proxyManager.getNextProxy).toHaveBeenCalledTimes(1);
+      } finally {
+        timers.mockRestore();
+      }
+    });
+  });
+
+  describe('scrapeSubreddit', () => {
+    test('skips posts that knownPostIds reports as stored', async () => {
+      const scraper = createScraper();
+      const ids = ['known-1', 'known-2', 'known-3'];
+      (scraper as any).fetchPostList = async () => ids.map(postUrl);
+      const fetched: string[] = [];
+      client.get.mockImplementation(async (url: string) => {
+        const id = /\/comments\/([^/.]+)/.exec(url)?.[1] as string;
+        fetched.push(id);
+        return postThread(id);
+      });
+      const knownPostIds = mock(async (_ids: string[]) => new Set(['known-2']));
+
+      const result = await scraper.scrapeSubreddit('test', ids.length, 'hot', { knownPostIds });
+
+      expect(knownPostIds).toHaveBeenCalledWith(ids);
+      expect(fetched.sort()).toEqual(['known-1', 'known-3']);
+      expect(result.status).toBe('success');
+      expect(result.totalPosts).toBe(2);
+    });
+
+    test('fetches nothing when every listed post is already stored', async () => {
+      const scraper = createScraper();
+      const ids = ['stored-1', 'stored-2'];
+      (scraper as any).fetchPostList = async () => ids.map(postUrl);
+
+      const result = await scraper.scrapeSubreddit('test', ids.length, 'hot', {
+        knownPostIds: async () => new Set(ids),
+      });
+
+      expect(client.get).not.toHaveBeenCalled();
+      expect(result).toEqual({ status: 'success', posts: [], scrapedCount: 0, totalPosts: 0 });
+    });
+  });
+
+  describe('concurrent post fetching', () => {
+    test('a slow post switching proxy does not cancel the posts fetched beside it', async () => {
+      const timers = speedUpSlowRequestTimers();
+
+      try {
+        const proxyManager = createProxyManager();
+        const scraper = createScraper(proxyManager);
+        const firstProxyId = (scraper as any).currentProxy.id;
+
+        // The two slow posts start first; the others start 200ms later, so they are
+        // still in flight when the slow ones hit the smart switch, and finish well
+        // before their own switch timers would fire
+        let throttled = 0;
+        (scraper as any).throttle = async () => {
+          if (throttled++ >= 2) await sleep(200);
+        };
+
+        const signals = new Map<string, AbortSignal[]>();
+        client.get.mockImplementation((url: string, config: { signal: AbortSignal }) => {
+          const id = /\/comments\/([^/.]+)/.exec(url)?.[1] as string;
+          const seen = signals.get(id) ?? [];
+          seen.push(config.signal);
+          signals.set(id, seen);
+
+          if (id.startsWith('abort-slow') && seen.length === 1) {
+            return new Promise((_, reject) => {
+              config.signal.addEventListener('abort', () => reject(canceledError()));
+            });
+          }
+          return sleep(300).then(() =>
+            config.signal.aborted ? Promise.reject(canceledError()) : postThread(id),
+          );
+        });
+
+        const ids = ['abort-slow-1', 'abort-slow-2', 'abort-1', 'abort-2', 'abort-3', 'abort-4'];
+        (scraper as any).fetchPostList = async () => ids.map(postUrl);
+
+        const result = await scraper.scrapeSubreddit('test', ids.length, 'hot');
+
+        expect(result.status).toBe('success');
+        expect(result.posts?.map(({ post }) => post.id).sort()).toEqual([...ids].sort());
+        for (const id of ids.filter((id) => !id.startsWith('abort-slow'))) {
+          expect(signals.get(id)?.length).toBe(1);
+          expect(signals.get(id)?.[0].aborted).toBe(false);
+        }
+        // Both slow posts retried once; only the first switch rotated the proxy
+        expect(signals.get('abort-slow-1')?.length).toBe(2);
+        expect(signals.get('abort-slow-2')?.length).toBe(2);
+        expect(proxyManager.getNextProxy).toHaveBeenCalledTimes(1);
+        expect(proxyManager.markProxyFailed.mock.calls.map(([id]) => id)).toEqual([firstProxyId]);
+      } finally {
+        timers.mockRestore();
+      }
+    });
+  });
+});
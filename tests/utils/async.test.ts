@@ -14,6 +14,33 @@ describe('Async Utils', () => {
     });
   });
 
+  describe('mapWithConcurrency', () => {
+    test('should keep input order and cap calls in flight', async () => {
+      let inFlight = 0;
+      let peak = 0;
+      const result = await retry.mapWithConcurrency([30, 10, 20, 5, 15], 2, async (ms, i) => {
+        inFlight++;
+        peak = Math.max(peak, inFlight);
+        await retry.sleep(ms);
+        inFlight--;
+        return i * 2;
+      });
+
+      expect(result).toEqual([0, 2, 4, 6, 8]);
+      expect(peak).toBe(2);
+    });
+
+    test('should stop taking items after a rejection', async () => {
+      const fn = mock(async (n: number) => {
+        if (n === 1) throw new Error('boom');
+        return n;
+      });
+
+      await expect(retry.mapWithConcurrency([1, 2, 3, 4], 1, fn)).rejects.toThrow('boom');
+      expect(fn).toHaveBeenCalledTimes(1);
+    });
+  });
+
   describe('retryWithBackoff', () => {
     test('should succeed on first attempt', async () => {
       const fn = mock(() => Promise.resolve('success'));
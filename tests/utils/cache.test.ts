@@ -0,0 +1,32 @@
+import { afterEach, describe, expect, setSystemTime, test } from 'bun:test';
+import { TtlCache } from '../../utils/cache';
+
+describe('TtlCache', () => {
+  afterEach(() => {
+    setSystemTime();
+  });
+
+  test('returns stored values until they expire', () => {
+    const start = new Date('2024-01-01T00:00:00Z');
+    setSystemTime(start);
+    const cache = new TtlCache<string, number>();
+    cache.set('a', 1, 1000);
+    expect(cache.get('a')).toBe(1);
+
+    setSystemTime(new Date(start.getTime() + 1000));
+    expect(cache.get('a')).toBeUndefined();
+    expect(cache.size).toBe(0);
+  });
+
+  test('evicts the least recently used entry when full', () => {
+    const cache = new TtlCache<string, number>(2);
+    cache.set('a', 1, 60000);
+    cache.set('b', 2, 60000);
+    cache.get('a');
+    cache.set('c', 3, 60000);
+
+    expect(cache.get('a')).toBe(1);
+    expect(cache.get('b')).toBeUndefined();
+    expect(cache.get('c')).toBe(3);
+  });
+});
@@ -69,6 +69,17 @@ describe('ConfigManager', () => {
       resetConfigManager();
     });
 
+    test('should read queue concurrency from the environment', () => {
+      process.env.QUEUE_CONCURRENCY = '4';
+      expect(new ConfigManager().getQueueConfig().concurrency).toBe(4);
+
+      process.env.QUEUE_CONCURRENCY = 'zero';
+      expect(new ConfigManager().getQueueConfig().concurrency).toBe(2);
+
+      delete process.env.QUEUE_CONCURRENCY;
+      resetConfigManager();
+    });
+
     test('should prioritize environment variables over config file', () => {
       const tempDir = require('node:os').tmpdir();
       const fileConfig = { server: { port: 8080, host: '0.0.0.0' }, output: { baseDir: tempDir } };
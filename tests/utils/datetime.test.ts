@@ -90,6 +90,13 @@ describe('DateTime Utils', () => {
         expect(result.iso).toContain('.123');
       });
 
+      test('should keep timezones apart across repeated calls', () => {
+        const date = new Date('2024-01-01T12:34:56Z');
+        expect(formatZonedTimestamp(date, 'UTC').iso).toBe('2024-01-01T12:34:56.000+00:00');
+        expect(formatZonedTimestamp(date, 'Asia/Tokyo').iso).toBe('2024-01-01T21:34:56.000+09:00');
+        expect(formatZonedTimestamp(date, 'UTC').iso).toBe('2024-01-01T12:34:56.000+00:00');
+      });
+
       test('should create file-safe format', () => {
         const date = new Date('2024-01-01T00:00:00Z');
         const result = formatZonedTimestamp(date, 'UTC');
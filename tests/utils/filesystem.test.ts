@@ -211,6 +211,16 @@ describe('FileSystem Utils', () => {
         expect(files[0]).toContain('normal.md');
       });
 
+      test('should skip directories with a .md name', async () => {
+        const dir = path.join(testOutputDir, 'markdown-test3');
+        await fsPromises.mkdir(path.join(dir, 'notes.md'), { recursive: true });
+        await fsPromises.writeFile(path.join(dir, 'real.md'), 'content');
+
+        const files = await fileUtils.getMarkdownFiles(dir);
+
+        expect(files).toEqual([path.join(dir, 'real.md')]);
+      });
+
       test('should return empty array for non-existent directory', async () => {
         const files = await fileUtils.getMarkdownFiles('/non/existent/path');
         expect(files).toEqual([]);
@@ -363,6 +373,12 @@ describe('FileSystem Utils', () => {
         expect(instance1).toBe(instance2);
       });
 
+      test('should keep the instance when config resolves to the same base dir', () => {
+        const instance1 = getOutputPathManager();
+        const instance2 = getOutputPathManager({ baseDir: instance1.getBaseDir() });
+        expect(instance2).toBe(instance1);
+      });
+
       test('should allow reset for testing', () => {
         const instance1 = getOutputPathManager();
         resetOutputPathManager();
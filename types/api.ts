@@ -33,6 +33,8 @@ export interface ScrapeRequest {
   parallelChunks?: number;
   /** Reddit only: subreddit scraping strategy */
   strategy?: RedditStrategy;
+  /** Reddit only: skip posts already stored in the database (optional, default: false) */
+  skipExisting?: boolean;
   /**
    * Anti-detection level (optional, default: 'high')
    * - 'low': Basic fingerprint only
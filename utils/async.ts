@@ -55,6 +55,36 @@ export async function sleepOrCancel(
   }
 }
 
+/**
+ * Map items through an async fn with at most `limit` calls in flight.
+ * Results keep input order; the first rejection stops workers from taking new items.
+ */
+export async function mapWithConcurrency<T, R>(
+  items: readonly T[],
+  limit: number,
+  fn: (item: T, index: number) => Promise<R>,
+): Promise<R[]> {
+  const results = new Array<R>(items.length);
+  let next = 0;
+  let failed = false;
+
+  const worker = async () => {
+    while (!failed && next < items.length) {
+      const index = next++;
+      try {
+        results[index] = await fn(items[index], index);
+      } catch (error) {
+        failed = true;
+        throw error;
+      }
+    }
+  };
+
+  const workers = Math.min(Math.max(1, limit), items.length);
+  await Promise.all(Array.from({ length: workers }, worker));
+  return results;
+}
+
 // ==========================================
 // Part 2: Retry Logic (from retry.ts)
 // ==========================================
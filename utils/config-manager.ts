@@ -204,6 +204,14 @@ export class ConfigManager {
       this.config.output.baseDir = path.resolve(process.env.OUTPUT_DIR);
     }
 
+    // 队列配置（每个 worker 进程并行处理的任务数，按 CPU/带宽调整）
+    if (process.env.QUEUE_CONCURRENCY) {
+      const concurrency = parseInt(process.env.QUEUE_CONCURRENCY, 10);
+      if (concurrency > 0) {
+        this.config.queue.concurrency = concurrency;
+      }
+    }
+
     // Twitter 配置
     if (process.env.TWITTER_DEFAULT_MODE) {
       const mode = process.env.TWITTER_DEFAULT_MODE as 'graphql' | 'puppeteer';
@@ -12,10 +12,47 @@ import dayjs from 'dayjs';
 const DEFAULT_TIMEZONE: string =
   process.env.TWITTER_CRAWLER_TIMEZONE || process.env.TWITTER_CRAWLER_TZ || process.env.TZ || 'UTC';
 
+// Building an Intl.DateTimeFormat loads locale and zone data, which costs far more
+// than formatting with one; keep one formatter per timezone for the process lifetime.
+const dateTimeFormatters = new Map<string, Intl.DateTimeFormat>();
+const offsetFormatters = new Map<string, Intl.DateTimeFormat>();
+
+function getDateTimeFormatter(timezone: string): Intl.DateTimeFormat {
+  let formatter = dateTimeFormatters.get(timezone);
+  if (!formatter) {
+    formatter = new Intl.DateTimeFormat('en-CA', {
+      timeZone: timezone,
+      hour12: false,
+      year: 'numeric',
+      month: '2-digit',
+      day: '2-digit',
+      hour: '2-digit',
+      minute: '2-digit',
+      second: '2-digit',
+    });
+    dateTimeFormatters.set(timezone, formatter);
+  }
+  return formatter;
+}
+
+function getOffsetFormatter(timezone: string): Intl.DateTimeFormat {
+  let formatter = offsetFormatters.get(timezone);
+  if (!formatter) {
+    formatter = new Intl.DateTimeFormat('en-US', {
+      timeZone: timezone,
+      hour12: false,
+      timeZoneName: 'shortOffset',
+    });
+    offsetFormatters.set(timezone, formatter);
+  }
+  return formatter;
+}
+
 export function isValidTimezone(timezone: string | null | undefined): boolean {
   try {
     if (!timezone) return false;
-    new Intl.DateTimeFormat('en-US', { timeZone: timezone }).format(new Date());
+    // Throws RangeError for unknown zones; valid ones stay cached for formatting
+    getDateTimeFormatter(timezone);
     return true;
   } catch (_error) {
     return false;
@@ -79,18 +116,7 @@ export function formatZonedTimestamp(
   const tz = resolveTimezone(timezone);
   const { includeMilliseconds = true, includeOffset = true } = options;
 
-  const baseFormatter = new Intl.DateTimeFormat('en-CA', {
-    timeZone: tz,
-    hour12: false,
-    year: 'numeric',
-    month: '2-digit',
-    day: '2-digit',
-    hour: '2-digit',
-    minute: '2-digit',
-    second: '2-digit',
-  });
-
-  const parts = baseFormatter.formatToParts(date);
+  const parts = getDateTimeFormatter(tz).formatToParts(date);
   const partMap: Record<string, string> = {};
   parts.forEach(({ type, value }) => {
     if (type !== 'literal') partMap[type] = value;
@@ -102,12 +128,7 @@ export function formatZonedTimestamp(
 
   let offset = '+00:00';
   if (includeOffset) {
-    const offsetFormatter = new Intl.DateTimeFormat('en-US', {
-      timeZone: tz,
-      hour12: false,
-      timeZoneName: 'shortOffset',
-    });
-    const offsetParts = offsetFormatter.formatToParts(date);
+    const offsetParts = getOffsetFormatter(tz).formatToParts(date);
     const tzName = offsetParts.find((part) => part.type === 'timeZoneName');
     if (tzName?.value) {
       offset = normalizeOffset(tzName.value);
@@ -4,9 +4,12 @@
 
 import { promises as fs } from 'node:fs';
 import * as path from 'node:path';
+import { mapWithConcurrency } from './async';
 import { ensureBaseStructure, getDefaultOutputRoot, getMarkdownFiles, RunContext } from './filesystem';
 
 const DEFAULT_CONVERGENCE_DIR = path.join(getDefaultOutputRoot(), 'convergence');
+// Source files read in parallel while merging; reads are I/O-bound
+const FILE_READ_CONCURRENCY = 4;
 const COOKIE_FILE = path.join(__dirname, '..', 'env.json');
 
 type Platform = 'x' | 'medium';
@@ -104,18 +107,12 @@ export async function mergeMarkdownFiles(
     ].join('\n');
 
     const separator = '\n\n---\n\n';
-    let itemIndex = 1;
-    let allItemsContent = '';
-
-    for (const file of mdFiles) {
-      const content = await fs.readFile(file, 'utf-8');
-      allItemsContent += `## ${itemIndex}.\n\n${content}${separator}`;
-      itemIndex++;
-    }
-
-    if (allItemsContent.endsWith(separator)) {
-      allItemsContent = allItemsContent.slice(0, -separator.length);
-    }
+    const contents = await mapWithConcurrency(mdFiles, FILE_READ_CONCURRENCY, (file) =>
+      fs.readFile(file, 'utf-8'),
+    );
+    const allItemsContent = contents
+      .map((content, i) => `## ${i + 1}.\n\n${content}`)
+      .join(separator);
 
     const finalContent = metadataBlock + allItemsContent;
     const mergedFilePath = path.join(outputDir, mergedFilename);
@@ -48,10 +48,17 @@ export function getTodayString(): string {
 export async function getMarkdownFiles(dir: string): Promise<string[]> {
   if (!dir) return [];
   try {
-    const files = await fsPromises.readdir(dir);
-    return files
-      .filter((file) => file.endsWith('.md') && !file.startsWith('merged-') && !file.startsWith('digest-'))
-      .map((file) => path.join(dir, file));
+    // Dirents carry the file type, so directories are skipped without a stat per entry
+    const entries = await fsPromises.readdir(dir, { withFileTypes: true });
+    return entries
+      .filter(
+        (entry) =>
+          entry.isFile() &&
+          entry.name.endsWith('.md') &&
+          !entry.name.startsWith('merged-') &&
+          !entry.name.startsWith('digest-'),
+      )
+      .map((entry) => path.join(dir, entry.name));
   } catch (_error: any) {
     return [];
   }
@@ -83,11 +90,15 @@ export const DEFAULT_OUTPUT_ROOT = DEFAULT_BASE_DIR;
 
 let singletonInstance: OutputPathManager | null = null;
 
+function resolveBaseDir(config: OutputPathConfig = {}): string {
+  return config.baseDir || process.env.OUTPUT_DIR || DEFAULT_BASE_DIR;
+}
+
 export class OutputPathManager {
   private baseDir: string;
 
   constructor(config: OutputPathConfig = {}) {
-    this.baseDir = config.baseDir || process.env.OUTPUT_DIR || DEFAULT_BASE_DIR;
+    this.baseDir = resolveBaseDir(config);
     if (!fs.existsSync(this.baseDir)) {
       fs.mkdirSync(this.baseDir, { recursive: true });
     }
@@ -110,9 +121,11 @@ export class OutputPathManager {
     const markdownDir = path.join(runDir, 'markdown');
     const screenshotDir = path.join(runDir, 'screenshots');
 
-    await fsPromises.mkdir(runDir, { recursive: true });
-    await fsPromises.mkdir(markdownDir, { recursive: true });
-    await fsPromises.mkdir(screenshotDir, { recursive: true });
+    // Recursive mkdir of the two leaf dirs creates runDir along the way
+    await Promise.all([
+      fsPromises.mkdir(markdownDir, { recursive: true }),
+      fsPromises.mkdir(screenshotDir, { recursive: true }),
+    ]);
 
     return {
       platform: sanitizeSegment(platform),
@@ -141,7 +154,12 @@ export class OutputPathManager {
 }
 
 export function getOutputPathManager(config?: OutputPathConfig): OutputPathManager {
-  if (!singletonInstance || config) {
+  // createRunContext passes a config on every run; only rebuild (and re-stat the
+  // base dir) when it actually points somewhere else
+  if (
+    !singletonInstance ||
+    (config && resolveBaseDir(config) !== singletonInstance.getBaseDir())
+  ) {
     singletonInstance = new OutputPathManager(config);
   }
   return singletonInstance;
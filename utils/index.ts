@@ -5,6 +5,7 @@
 
 export * from './ai-export';
 export * from './async';  // Consolidated: retry + concurrency
+export * from './cache';
 export {
   type AppConfig,
   ConfigManager,